@@ -0,0 +1,38 @@
+"""Drop redundant room_code index and make the active-game index covering.
+
+Revision ID: 003_games_room_code_indexes
+Revises: 002_updated_at_triggers
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_games_room_code_indexes"
+down_revision: str | None = "002_updated_at_triggers"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # uq_games_room_code already maintains a unique B-tree on room_code
+    op.drop_index("ix_games_room_code", table_name="games")
+
+    # Declared on the model but never created by 001_initial
+    op.execute("DROP INDEX IF EXISTS ix_games_active_room_code")
+    op.create_index(
+        "ix_games_active_room_code",
+        "games",
+        ["room_code"],
+        postgresql_include=["id", "status"],
+        postgresql_where=sa.text("status != 'finished'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_games_active_room_code", table_name="games")
+    op.create_index("ix_games_room_code", "games", ["room_code"])
@@ -0,0 +1,54 @@
+"""Generated win_rate/average_score columns on player_stats.
+
+Revision ID: 005_player_stats_rates
+Revises: 003_games_room_code_indexes
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_player_stats_rates"
+down_revision: str | None = "003_games_room_code_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "player_stats",
+        sa.Column(
+            "win_rate",
+            sa.Float(),
+            sa.Computed(
+                "CASE WHEN total_games = 0 THEN 0 "
+                "ELSE total_wins * 100.0 / total_games END",
+                persisted=True,
+            ),
+            comment="Percentage of games won",
+        ),
+    )
+    op.add_column(
+        "player_stats",
+        sa.Column(
+            "average_score",
+            sa.Float(),
+            sa.Computed(
+                "CASE WHEN total_games = 0 THEN 0 "
+                "ELSE total_points * 1.0 / total_games END",
+                persisted=True,
+            ),
+            comment="Average points per game",
+        ),
+    )
+    op.create_index("ix_player_stats_win_rate", "player_stats", ["win_rate"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_player_stats_win_rate", table_name="player_stats")
+    op.drop_column("player_stats", "average_score")
+    op.drop_column("player_stats", "win_rate")
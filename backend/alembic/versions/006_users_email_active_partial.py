@@ -0,0 +1,33 @@
+"""Partial index on active users' email.
+
+Revision ID: 006_users_email_active_partial
+Revises: 005_player_stats_rates
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_users_email_active_partial"
+down_revision: str | None = "005_player_stats_rates"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_users_email_active", table_name="users")
+    op.create_index(
+        "ix_users_email_active",
+        "users",
+        ["email"],
+        postgresql_where=sa.text("is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_email_active", table_name="users")
+    op.create_index("ix_users_email_active", "users", ["email", "is_active"])
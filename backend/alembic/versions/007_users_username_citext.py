@@ -0,0 +1,48 @@
+"""Case-insensitive username column.
+
+Revision ID: 007_users_username_citext
+Revises: 006_users_email_active_partial
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_users_username_citext"
+down_revision: str | None = "006_users_email_active_partial"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.alter_column(
+        "users",
+        "username",
+        type_=postgresql.CITEXT(),
+        existing_type=sa.String(32),
+        existing_nullable=False,
+    )
+    # uq_users_username is now case-insensitive on its own
+    op.drop_index("ix_users_username_lower", table_name="users")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_users_username_lower",
+        "users",
+        [sa.func.lower(sa.column("username"))],
+        unique=True,
+    )
+    op.alter_column(
+        "users",
+        "username",
+        type_=sa.String(32),
+        existing_type=postgresql.CITEXT(),
+        existing_nullable=False,
+    )
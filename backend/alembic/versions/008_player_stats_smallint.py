@@ -0,0 +1,44 @@
+"""Narrow bounded player_stats columns to smallint.
+
+Revision ID: 008_player_stats_smallint
+Revises: 007_users_username_citext
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_player_stats_smallint"
+down_revision: str | None = "007_users_username_citext"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Per-round and streak values, bounded by the game rules
+BOUNDED_COLUMNS = ("highest_round_score", "current_streak", "best_streak")
+
+
+def upgrade() -> None:
+    for column in BOUNDED_COLUMNS:
+        op.alter_column(
+            "player_stats",
+            column,
+            type_=sa.SmallInteger(),
+            existing_type=sa.Integer(),
+            existing_nullable=False,
+            postgresql_using=f"{column}::smallint",
+        )
+
+
+def downgrade() -> None:
+    for column in BOUNDED_COLUMNS:
+        op.alter_column(
+            "player_stats",
+            column,
+            type_=sa.Integer(),
+            existing_type=sa.SmallInteger(),
+            existing_nullable=False,
+        )
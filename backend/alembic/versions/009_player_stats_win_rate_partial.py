@@ -0,0 +1,33 @@
+"""Restrict the win rate index to players with finished games.
+
+Revision ID: 009_player_stats_win_rate_partial
+Revises: 008_player_stats_smallint
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_player_stats_win_rate_partial"
+down_revision: str | None = "008_player_stats_smallint"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_player_stats_win_rate", table_name="player_stats")
+    op.create_index(
+        "ix_player_stats_win_rate",
+        "player_stats",
+        ["win_rate"],
+        postgresql_where=sa.text("total_games > 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_player_stats_win_rate", table_name="player_stats")
+    op.create_index("ix_player_stats_win_rate", "player_stats", ["win_rate"])
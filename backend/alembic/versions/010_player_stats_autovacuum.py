@@ -0,0 +1,28 @@
+"""Analyze player_stats more eagerly.
+
+Revision ID: 010_player_stats_autovacuum
+Revises: 009_player_stats_win_rate_partial
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_player_stats_autovacuum"
+down_revision: str | None = "009_player_stats_win_rate_partial"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Every round rewrites each player's row; keep planner stats fresh
+    op.execute(
+        "ALTER TABLE player_stats SET (autovacuum_analyze_scale_factor = 0.02)"
+    )
+    op.execute("ANALYZE player_stats")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE player_stats RESET (autovacuum_analyze_scale_factor)")
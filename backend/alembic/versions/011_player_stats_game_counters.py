@@ -0,0 +1,55 @@
+"""Count finished games and wins in player_stats with a trigger.
+
+The trigger fires when games.status changes to 'finished'. No code path
+in the app finishes a game yet, so it stays dormant until game-end
+handling sets that status (together with games.winner_id).
+
+Revision ID: 011_player_stats_game_counters
+Revises: 010_player_stats_autovacuum
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_player_stats_game_counters"
+down_revision: str | None = "010_player_stats_autovacuum"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_player_game_counters() RETURNS trigger AS $$
+        BEGIN
+            -- Upsert so players without a stats row yet are still counted
+            INSERT INTO player_stats (id, user_id, total_games, total_wins)
+            SELECT gen_random_uuid(),
+                   gp.user_id,
+                   1,
+                   (gp.user_id IS NOT DISTINCT FROM NEW.winner_id)::int
+            FROM game_players AS gp
+            WHERE gp.game_id = NEW.id
+            ON CONFLICT (user_id) DO UPDATE
+            SET total_games = player_stats.total_games + 1,
+                total_wins = player_stats.total_wins + EXCLUDED.total_wins;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "CREATE TRIGGER trg_games_finished_player_stats "
+        "AFTER UPDATE OF status ON games "
+        "FOR EACH ROW "
+        "WHEN (NEW.status = 'finished' AND OLD.status IS DISTINCT FROM NEW.status) "
+        "EXECUTE FUNCTION bump_player_game_counters()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_games_finished_player_stats ON games")
+    op.execute("DROP FUNCTION IF EXISTS bump_player_game_counters()")
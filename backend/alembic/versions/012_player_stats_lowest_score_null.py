@@ -0,0 +1,41 @@
+"""Use NULL instead of 0 as the lowest_score sentinel.
+
+Revision ID: 012_player_stats_lowest_score_null
+Revises: 011_player_stats_game_counters
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_player_stats_lowest_score_null"
+down_revision: str | None = "011_player_stats_game_counters"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "player_stats",
+        "lowest_score",
+        existing_type=sa.Integer(),
+        nullable=True,
+        server_default=None,
+    )
+    # Rows that never played a round still hold the old 0 sentinel
+    op.execute("UPDATE player_stats SET lowest_score = NULL WHERE total_rounds = 0")
+
+
+def downgrade() -> None:
+    op.execute("UPDATE player_stats SET lowest_score = 0 WHERE lowest_score IS NULL")
+    op.alter_column(
+        "player_stats",
+        "lowest_score",
+        existing_type=sa.Integer(),
+        nullable=False,
+        server_default="0",
+    )
@@ -0,0 +1,42 @@
+"""Size users.password_hash to the bcrypt hash length.
+
+Revision ID: 013_users_password_hash_length
+Revises: 012_player_stats_lowest_score_null
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_users_password_hash_length"
+down_revision: str | None = "012_player_stats_lowest_score_null"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "users",
+        "password_hash",
+        type_=sa.String(60),
+        existing_type=sa.String(128),
+        existing_nullable=False,
+        existing_comment="Bcrypt hashed password",
+        comment="Bcrypt hashed password (always 60 chars)",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "users",
+        "password_hash",
+        type_=sa.String(128),
+        existing_type=sa.String(60),
+        existing_nullable=False,
+        existing_comment="Bcrypt hashed password (always 60 chars)",
+        comment="Bcrypt hashed password",
+    )
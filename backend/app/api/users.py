@@ -124,7 +124,7 @@ async def get_user_stats(
     - win_rate: Percentage of games won
     - average_score: Average points per game
     - highest_score: Highest single-game score
-    - lowest_score: Lowest single-game score
+    - lowest_score: Lowest single-round score (null until a round is played)
     - contracts_made: Successful contracts
     - contracts_failed: Failed contracts
     - contract_success_rate: Percentage of contracts made
@@ -34,13 +34,18 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: RedisDsn
-    redis_pool_size: int = 10
+    redis_pool_size: int = 64
+    redis_pool_timeout: int = 5
+    redis_health_check_interval: int = 30
 
     # JWT
     jwt_secret_key: str
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 30
     jwt_refresh_token_expire_days: int = 7
+    jwt_cache_enabled: bool = True
+    jwt_cache_max_size: int = 10_000
+    jwt_cache_ttl_seconds: int = 30
 
     # Security
     bcrypt_rounds: int = 12
@@ -0,0 +1,21 @@
+"""Cheap wall-clock timestamps for Redis bookkeeping."""
+import time
+from datetime import datetime
+
+# (epoch second, ISO string) of the last formatted timestamp
+_cache: tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """Return the current naive UTC time as an ISO string.
+
+    Resolution is one second: calls within the same wall-clock second
+    share one formatted string instead of building a datetime each time.
+    """
+    global _cache
+    now = int(time.time())
+    second, iso = _cache
+    if second != now:
+        iso = datetime.utcfromtimestamp(now).isoformat()
+        _cache = (now, iso)
+    return iso
@@ -0,0 +1,70 @@
+"""In-process cache of verified JWT payloads."""
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from app.config import get_settings
+
+
+class JWTCache:
+    """
+    Bounded TTL cache mapping a token digest to its decoded claims.
+
+    Entries live for at most ``ttl_seconds`` and never past the token's
+    own ``exp`` claim. Only successfully verified tokens are stored, so a
+    hit is always a token that passed signature and expiry checks.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: int) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()[:16]
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        """Return cached claims for a token, or None on miss/expiry."""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        return payload
+
+    def set(self, token: str, payload: dict[str, Any]) -> None:
+        """Cache verified claims until min(now + ttl, exp)."""
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        exp = payload.get("exp")
+        if isinstance(exp, int | float):
+            expires_at = min(expires_at, float(exp))
+        if expires_at <= now:
+            return
+
+        key = self._key(token)
+        self._entries[key] = (expires_at, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+@lru_cache
+def get_jwt_cache() -> JWTCache:
+    """Get the process-wide JWT cache sized from settings."""
+    settings = get_settings()
+    return JWTCache(
+        max_size=settings.jwt_cache_max_size,
+        ttl_seconds=settings.jwt_cache_ttl_seconds,
+    )
@@ -1,5 +1,5 @@
 """Redis connection pool management."""
-from redis.asyncio import ConnectionPool, Redis  # type: ignore
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis  # type: ignore
 
 from app.config import get_settings
 
@@ -12,11 +12,19 @@ class RedisManager:
         self._client: Redis | None = None  # type: ignore
 
     async def initialize(self, redis_url: str) -> None:
-        """Initialize the Redis connection pool."""
+        """Initialize the Redis connection pool.
+
+        The pool is shared by every service and the room manager. A
+        blocking pool makes bursts of concurrent pipelines wait briefly
+        for a free connection instead of failing with "Too many
+        connections".
+        """
         settings = get_settings()
-        self._pool = ConnectionPool.from_url(
+        self._pool = BlockingConnectionPool.from_url(
             redis_url,
             max_connections=settings.redis_pool_size,
+            timeout=settings.redis_pool_timeout,
+            health_check_interval=settings.redis_health_check_interval,
             decode_responses=True,
         )
         self._client = Redis(connection_pool=self._pool)
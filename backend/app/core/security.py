@@ -1,23 +1,34 @@
 """Security utilities for password hashing and JWT tokens."""
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.config import get_settings
+from app.core.jwt_cache import get_jwt_cache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+@lru_cache
+def get_pwd_context() -> CryptContext:
+    """Get the process-wide bcrypt context with the configured cost factor."""
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=get_settings().bcrypt_rounds,
+    )
 
 
 def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    """Hash a password using bcrypt with the configured cost factor."""
+    return get_pwd_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 
 def create_access_token(
@@ -81,14 +92,27 @@ def create_refresh_token(
 
 
 def decode_token(token: str) -> dict[str, Any]:
-    """Decode and verify a JWT token."""
+    """Decode and verify a JWT token.
+
+    Verified payloads are cached briefly (see JWTCache) so repeated
+    requests with the same token skip signature verification.
+    """
     settings = get_settings()
-    return jwt.decode(
+    if settings.jwt_cache_enabled:
+        cached = get_jwt_cache().get(token)
+        if cached is not None:
+            return cached
+
+    payload: dict[str, Any] = jwt.decode(
         token,
         settings.jwt_secret_key,
         algorithms=[settings.jwt_algorithm],
     )
 
+    if settings.jwt_cache_enabled:
+        get_jwt_cache().set(token, payload)
+    return payload
+
 
 def verify_token_type(token_payload: dict[str, Any], expected_type: str) -> bool:
     """Verify that a token is of the expected type."""
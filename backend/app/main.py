@@ -6,6 +6,7 @@ from typing import Any
 import socketio  # type: ignore
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 
 from app.api.router import router
@@ -60,6 +61,7 @@ def create_app() -> FastAPI:
         description="Whist Score Keeper - A real-time scoring application for Whist card game",
         debug=settings.debug,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         openapi_url="/openapi.json",
     )
@@ -1,21 +1,47 @@
 """Base model configuration for all SQLAlchemy models."""
+import os
+import time
+from collections.abc import Mapping
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import ClassVar
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, MetaData, func
+from sqlalchemy import DateTime, FetchedValue, MetaData, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 # Naming convention for constraints (required for Alembic autogenerate)
-NAMING_CONVENTION: dict[str, str] = {
+NAMING_CONVENTION: Mapping[str, str] = MappingProxyType({
     "ix": "ix_%(column_0_label)s",
     "uq": "uq_%(table_name)s_%(column_0_name)s",
     "ck": "ck_%(table_name)s_%(constraint_name)s",
     "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
     "pk": "pk_%(table_name)s",
-}
+})
+
+# Shared column types: type objects are stateless, so every UUID and
+# timestamp column reuses one instance instead of building its own.
+UUID_TYPE = PG_UUID(as_uuid=True)
+TIMESTAMP_TYPE = DateTime(timezone=True)
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so new
+    primary keys land at the right edge of the B-tree index instead of
+    at random leaf pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= (rand >> 62 & 0xFFF) << 64  # rand_a
+    value |= 0b10 << 62  # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b
+    return UUID(int=value)
 
 
 class Base(DeclarativeBase):
@@ -25,34 +51,41 @@ class Base(DeclarativeBase):
 
     # Type annotation map for custom types
     type_annotation_map: ClassVar = {
-        UUID: PG_UUID(as_uuid=True),
-        datetime: DateTime(timezone=True),
+        UUID: UUID_TYPE,
+        datetime: TIMESTAMP_TYPE,
     }
 
 
 class TimestampMixin:
-    """Mixin that adds created_at and updated_at columns."""
+    """Mixin that adds created_at and updated_at columns.
+
+    updated_at is maintained by the set_updated_at() BEFORE UPDATE trigger
+    (see migration 002), so UPDATE statements don't render it. Eager
+    defaults fetch the new value via RETURNING in the same statement.
+    """
+
+    __mapper_args__: ClassVar = {"eager_defaults": True}
 
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TIMESTAMP_TYPE,
         server_default=func.now(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
+        TIMESTAMP_TYPE,
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
 
 class UUIDPrimaryKeyMixin:
-    """Mixin that adds a UUID primary key."""
+    """Mixin that adds a time-ordered UUID primary key."""
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True),
+        UUID_TYPE,
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
         nullable=False,
     )
 
@@ -38,7 +38,6 @@ class Game(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         String(6),
         unique=True,
         nullable=False,
-        index=True,
         comment="6-character room code for joining (e.g., 'ABC123')",
     )
 
@@ -128,10 +127,13 @@ class Game(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         Index("ix_games_group_status", "group_id", "status"),
         # Index for finding games by admin
         Index("ix_games_admin_created", "admin_id", "created_at"),
-        # Partial index for active games only (most queries)
+        # Partial index for active games only (most queries); covers id and
+        # status so room-code lookups can be answered by index-only scans.
+        # Plain room_code lookups use the unique constraint's index.
         Index(
             "ix_games_active_room_code",
             "room_code",
+            postgresql_include=["id", "status"],
             postgresql_where=(status != GameStatus.FINISHED),
         ),
         {
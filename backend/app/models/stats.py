@@ -2,7 +2,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, Integer
+from sqlalchemy import Computed, Float, ForeignKey, Index, Integer, SmallInteger, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,7 +29,8 @@ class PlayerStats(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         comment="The user these stats belong to",
     )
 
-    # Game counts
+    # Game counts (total_games/total_wins are upserted by a trigger when a game
+    # finishes, see migration 011; dormant until game-end handling exists)
     total_games: Mapped[int] = mapped_column(
         Integer,
         default=0,
@@ -62,14 +63,13 @@ class PlayerStats(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         nullable=False,
         comment="Highest single-game score",
     )
-    lowest_score: Mapped[int] = mapped_column(
+    lowest_score: Mapped[int | None] = mapped_column(
         Integer,
-        default=0,
-        nullable=False,
-        comment="Lowest single-game score",
+        nullable=True,
+        comment="Lowest single-round score (null until a round is played)",
     )
     highest_round_score: Mapped[int] = mapped_column(
-        Integer,
+        SmallInteger,
         default=0,
         nullable=False,
         comment="Highest single-round score",
@@ -133,18 +133,39 @@ class PlayerStats(Base, UUIDPrimaryKeyMixin, TimestampMixin):
 
     # Streak tracking
     current_streak: Mapped[int] = mapped_column(
-        Integer,
+        SmallInteger,
         default=0,
         nullable=False,
         comment="Current win streak (negative for loss streak)",
     )
     best_streak: Mapped[int] = mapped_column(
-        Integer,
+        SmallInteger,
         default=0,
         nullable=False,
         comment="Best ever win streak",
     )
 
+    # Derived rates, generated by the database so leaderboards can sort on an index.
+    # Database-only: None on an instance until it has been flushed or loaded.
+    win_rate: Mapped[float | None] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN total_games = 0 THEN 0 "
+            "ELSE total_wins * 100.0 / total_games END",
+            persisted=True,
+        ),
+        comment="Percentage of games won",
+    )
+    average_score: Mapped[float | None] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN total_games = 0 THEN 0 "
+            "ELSE total_points * 1.0 / total_games END",
+            persisted=True,
+        ),
+        comment="Average points per game",
+    )
+
     # Relationships
     user: Mapped["User"] = relationship(
         "User",
@@ -158,25 +179,18 @@ class PlayerStats(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         Index("ix_player_stats_total_points", "total_points"),
         # Index for leaderboard by games
         Index("ix_player_stats_total_games", "total_games"),
+        # Index for leaderboard by win rate (players who never finished a game can't rank)
+        Index(
+            "ix_player_stats_win_rate",
+            "win_rate",
+            postgresql_where=text("total_games > 0"),
+        ),
+        # autovacuum_analyze_scale_factor is tuned in migration 010
         {
             "comment": "Aggregated player statistics updated after each game"
         },
     )
 
-    @property
-    def win_rate(self) -> float:
-        """Calculate win rate as a percentage."""
-        if self.total_games == 0:
-            return 0.0
-        return (self.total_wins / self.total_games) * 100
-
-    @property
-    def average_score(self) -> float:
-        """Calculate average score per game."""
-        if self.total_games == 0:
-            return 0.0
-        return self.total_points / self.total_games
-
     @property
     def contract_success_rate(self) -> float:
         """Calculate contract success rate as a percentage."""
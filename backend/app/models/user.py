@@ -2,8 +2,8 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, Index, String, Text, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Boolean, Index, String, Text, func, text
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDPrimaryKeyMixin
@@ -26,7 +26,8 @@ class User(Base, UUIDPrimaryKeyMixin, TimestampMixin):
 
     # Authentication fields
     username: Mapped[str] = mapped_column(
-        String(32),
+        # Case-insensitive on Postgres, so the unique index covers lookups
+        String(32).with_variant(CITEXT(), "postgresql"),
         unique=True,
         nullable=False,
         index=True,
@@ -40,9 +41,9 @@ class User(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         comment="Unique email address for login and recovery",
     )
     password_hash: Mapped[str] = mapped_column(
-        String(128),
+        String(60),
         nullable=False,
-        comment="Bcrypt hashed password",
+        comment="Bcrypt hashed password (always 60 chars)",
     )
 
     # Profile fields
@@ -79,40 +80,47 @@ class User(Base, UUIDPrimaryKeyMixin, TimestampMixin):
         comment="User preferences: theme, notifications, language",
     )
 
-    # Relationships
+    # Relationships (raise on lazy load: eager-load explicitly at the call site)
     created_groups: Mapped[list["Group"]] = relationship(
         "Group",
         back_populates="creator",
         foreign_keys="Group.created_by",
+        lazy="raise_on_sql",
     )
     group_memberships: Mapped[list["GroupMember"]] = relationship(
         "GroupMember",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     administered_games: Mapped[list["Game"]] = relationship(
         "Game",
         back_populates="admin",
         foreign_keys="Game.admin_id",
+        lazy="raise_on_sql",
     )
     game_participations: Mapped[list["GamePlayer"]] = relationship(
         "GamePlayer",
         back_populates="user",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     stats: Mapped["PlayerStats | None"] = relationship(
         "PlayerStats",
         back_populates="user",
         uselist=False,
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
     )
 
     # Indexes defined in __table_args__
     __table_args__ = (
-        # Composite index for login queries (email is most common)
-        Index("ix_users_email_active", "email", "is_active"),
-        # Index for username lookups
-        Index("ix_users_username_lower", func.lower(username), unique=True),
+        # Partial index for login queries (nearly every account is active)
+        Index(
+            "ix_users_email_active",
+            "email",
+            postgresql_where=text("is_active = true"),
+        ),
         {
             "comment": "User accounts with authentication and profile data"
         },
@@ -7,13 +7,47 @@ from pydantic import BaseModel, ConfigDict, Field
 
 
 class TrumpSuit(str, Enum):
-    """Trump suit enumeration."""
-
-    CLUBS = "clubs"
-    DIAMONDS = "diamonds"
-    HEARTS = "hearts"
-    SPADES = "spades"
-    NO_TRUMP = "no_trump"
+    """Trump suit enumeration.
+
+    Members keep their string value on the wire and carry an integer
+    ``rank`` used for bid ordering: clubs < diamonds < hearts < spades < no_trump.
+    Members are declared in rank order, so ``tuple(TrumpSuit)`` is already
+    sorted ascending and ``tuple(TrumpSuit)[-1]`` is the highest suit.
+    """
+
+    rank: int
+
+    def __new__(cls, value: str, rank: int) -> "TrumpSuit":
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.rank = rank
+        return member
+
+    CLUBS = ("clubs", 0)
+    DIAMONDS = ("diamonds", 1)
+    HEARTS = ("hearts", 2)
+    SPADES = ("spades", 3)
+    NO_TRUMP = ("no_trump", 4)
+
+    def __lt__(self, other: object) -> bool:
+        if isinstance(other, TrumpSuit):
+            return self.rank < other.rank
+        return NotImplemented
+
+    def __le__(self, other: object) -> bool:
+        if isinstance(other, TrumpSuit):
+            return self.rank <= other.rank
+        return NotImplemented
+
+    def __gt__(self, other: object) -> bool:
+        if isinstance(other, TrumpSuit):
+            return self.rank > other.rank
+        return NotImplemented
+
+    def __ge__(self, other: object) -> bool:
+        if isinstance(other, TrumpSuit):
+            return self.rank >= other.rank
+        return NotImplemented
 
 
 class GameType(str, Enum):
@@ -36,7 +36,7 @@ class PlayerStats(BaseModel):
     win_rate: float = 0.0
     average_score: float = 0.0
     highest_score: int = 0
-    lowest_score: int = 0
+    lowest_score: int | None = None
     contracts_made: int = 0
     contracts_failed: int = 0
     contract_success_rate: float = 0.0
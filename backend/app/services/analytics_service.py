@@ -1,10 +1,13 @@
 """Analytics service for calculating player and group statistics."""
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
 from redis.asyncio import Redis  # type: ignore[import-untyped]
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, case, func, select, update
+from sqlalchemy.dialects.postgresql import array, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Game, GroupMember, PlayerStats, User  # type: ignore[attr-defined]
@@ -12,6 +15,135 @@ from app.schemas.group import GroupLeaderboard, HeadToHeadStats
 from app.schemas.group import PlayerStats as PlayerStatsSchema
 
 
+@dataclass(frozen=True, slots=True)
+class RoundStatsUpdate:
+    """One player's result for a completed round."""
+
+    user_id: UUID
+    contract_bid: int
+    tricks_won: int
+    round_score: int
+    is_trump_winner: bool = False
+    trump_suit: str | None = None
+
+
+def _suit_win(suit: str) -> Any:
+    """Build ``jsonb_set`` bumping one suit's counter inside ``suit_wins``."""
+    count = func.coalesce(PlayerStats.suit_wins[suit].as_integer(), 0)
+    return func.jsonb_set(
+        PlayerStats.suit_wins,
+        array([suit]),
+        func.to_jsonb(count + 1),
+        True,
+        type_=PlayerStats.suit_wins.type,
+    )
+
+
+def _increment(column: Any, deltas: dict[UUID, int]) -> Any | None:
+    """Build ``column + CASE user_id ...`` from non-zero per-player deltas."""
+    whens = [(PlayerStats.user_id == uid, delta) for uid, delta in deltas.items() if delta]
+    if not whens:
+        return None
+    return column + case(*whens, else_=0)
+
+
+def _round_stats_update(updates: Sequence[RoundStatsUpdate]) -> Any:
+    """Build the single UPDATE applying a round's results to player stats."""
+    made = [
+        u.user_id
+        for u in updates
+        if u.contract_bid > 0 and u.tricks_won == u.contract_bid
+    ]
+    new_streak = PlayerStats.current_streak + 1
+
+    values: dict[str, Any] = {
+        "total_rounds": PlayerStats.total_rounds + 1,
+        "highest_round_score": case(
+            *(
+                (
+                    (PlayerStats.user_id == u.user_id)
+                    & (PlayerStats.highest_round_score < u.round_score),
+                    u.round_score,
+                )
+                for u in updates
+            ),
+            else_=PlayerStats.highest_round_score,
+        ),
+        "lowest_score": case(
+            *(
+                (
+                    (PlayerStats.user_id == u.user_id)
+                    & (
+                        PlayerStats.lowest_score.is_(None)
+                        | (PlayerStats.lowest_score > u.round_score)
+                    ),
+                    u.round_score,
+                )
+                for u in updates
+            ),
+            else_=PlayerStats.lowest_score,
+        ),
+        # Streak (simplified - only tracks made contracts)
+        "current_streak": (
+            case((PlayerStats.user_id.in_(made), new_streak), else_=0)
+            if made
+            else 0
+        ),
+    }
+    if made:
+        values["best_streak"] = case(
+            (
+                PlayerStats.user_id.in_(made) & (PlayerStats.best_streak < new_streak),
+                new_streak,
+            ),
+            else_=PlayerStats.best_streak,
+        )
+
+    increments = [
+        (PlayerStats.total_points, {u.user_id: u.round_score for u in updates}),
+        (
+            PlayerStats.zeros_attempted,
+            {u.user_id: int(u.contract_bid == 0) for u in updates},
+        ),
+        (
+            PlayerStats.zeros_made,
+            {
+                u.user_id: int(u.contract_bid == 0 and u.tricks_won == 0)
+                for u in updates
+            },
+        ),
+        (
+            PlayerStats.contracts_attempted,
+            {u.user_id: int(u.contract_bid > 0) for u in updates},
+        ),
+        (PlayerStats.contracts_made, dict.fromkeys(made, 1)),
+        (
+            PlayerStats.trump_wins,
+            {u.user_id: int(u.is_trump_winner) for u in updates},
+        ),
+    ]
+    for column, deltas in increments:
+        expression = _increment(column, deltas)
+        if expression is not None:
+            values[column.key] = expression
+
+    # Patched in place by Postgres so the JSONB never round-trips through Python
+    suit_wins = [
+        (PlayerStats.user_id == u.user_id, _suit_win(u.trump_suit))
+        for u in updates
+        if u.is_trump_winner and u.trump_suit
+    ]
+    if suit_wins:
+        values["suit_wins"] = case(*suit_wins, else_=PlayerStats.suit_wins)
+
+    return (
+        update(PlayerStats)
+        .where(PlayerStats.user_id.in_([u.user_id for u in updates]))
+        .values(values)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
 class AnalyticsService:
     """Service for analytics and statistics calculations."""
 
@@ -109,7 +241,7 @@ class AnalyticsService:
             total_rounds=stats.total_rounds,
             wins=stats.total_wins,
             losses=stats.total_games - stats.total_wins,
-            win_rate=stats.win_rate,
+            win_rate=stats.win_rate if stats.win_rate is not None else 0.0,
             average_score=average_score,
             average_round_score=average_round_score,
             total_made_contracts=stats.contracts_made,
@@ -140,69 +272,45 @@ class AnalyticsService:
         Returns:
             List of leaderboard entries sorted by score
         """
-        # Fetch all group members
-        members_result = await self.db.execute(
-            select(GroupMember.user_id).where(GroupMember.group_id == group_id)
-        )
-        user_ids = members_result.scalars().all()
-
-        # Fetch stats for each member
-        leaderboard_entries = []
-        for rank, user_id in enumerate(user_ids, 1):
-            # Get user info
-            user_result = await self.db.execute(
-                select(User).where(User.id == user_id)
-            )
-            user = user_result.scalar_one_or_none()
-            if not user:
-                continue
-
-            # Get stats
-            stats_result = await self.db.execute(
-                select(PlayerStats).where(PlayerStats.user_id == user_id)
-            )
-            stats = stats_result.scalar_one_or_none()
-            if not stats:
-                continue
-
-            # Get total score
-            try:
-                from app.models import RoundResult as RoundResultModel  # type: ignore[attr-defined]
-                score_result = await self.db.execute(
-                    select(func.sum(RoundResultModel.score)).where(
-                        RoundResultModel.user_id == user_id
-                    )
-                )
-                total_score = score_result.scalar() or 0
-            except (ImportError, AttributeError):
-                total_score = 0
-
-            # Calculate average round score
-            total_rounds = stats.total_rounds if stats.total_rounds > 0 else 1
-            average_round_score = (
-                total_score / total_rounds if total_rounds > 0 else 0.0
+        # One ranked query over members with stats, served by the
+        # ix_player_stats_total_points index instead of a per-member fetch
+        result = await self.db.execute(
+            select(
+                User.id,
+                User.display_name,
+                PlayerStats.total_points,
+                PlayerStats.total_rounds,
+                PlayerStats.total_games,
+                PlayerStats.total_wins,
             )
+            .join(GroupMember, GroupMember.user_id == User.id)
+            .join(PlayerStats, PlayerStats.user_id == User.id)
+            .where(GroupMember.group_id == group_id)
+            .order_by(PlayerStats.total_points.desc())
+            .limit(limit)
+        )
 
-            leaderboard_entries.append(
-                GroupLeaderboard(
-                    rank=rank,
-                    user_id=user_id,
-                    display_name=user.display_name,
-                    total_score=int(total_score),
-                    average_round_score=average_round_score,
-                    win_count=0,  # Simplified - would need game outcomes
-                    game_count=stats.total_games,
-                )
+        return [
+            GroupLeaderboard(
+                rank=rank,
+                user_id=user_id,
+                display_name=display_name,
+                total_score=total_points,
+                average_round_score=(
+                    total_points / total_rounds if total_rounds > 0 else 0.0
+                ),
+                win_count=total_wins,
+                game_count=total_games,
             )
-
-        # Sort by total score descending
-        leaderboard_entries.sort(key=lambda x: x.total_score, reverse=True)
-
-        # Update ranks
-        for rank, entry in enumerate(leaderboard_entries[:limit], 1):
-            entry.rank = rank
-
-        return leaderboard_entries[:limit]
+            for rank, (
+                user_id,
+                display_name,
+                total_points,
+                total_rounds,
+                total_games,
+                total_wins,
+            ) in enumerate(result.all(), 1)
+        ]
 
     async def get_head_to_head_stats(
         self,
@@ -318,6 +426,7 @@ class AnalyticsService:
         tricks_won: int,
         round_score: int,
         is_trump_winner: bool = False,
+        trump_suit: str | None = None,
     ) -> None:
         """Update player statistics after a round completes.
 
@@ -327,49 +436,54 @@ class AnalyticsService:
             tricks_won: Tricks won
             round_score: Score for round
             is_trump_winner: Whether player won trump bidding
+            trump_suit: Trump suit declared by the winner, counted in suit_wins
         """
-        # Get or create stats record
-        stats_result = await self.db.execute(
-            select(PlayerStats).where(PlayerStats.user_id == user_id)
+        await self.update_players_stats_after_round(
+            [
+                RoundStatsUpdate(
+                    user_id=user_id,
+                    contract_bid=contract_bid,
+                    tricks_won=tricks_won,
+                    round_score=round_score,
+                    is_trump_winner=is_trump_winner,
+                    trump_suit=trump_suit,
+                )
+            ]
         )
-        stats = stats_result.scalar_one_or_none()
-        if not stats:
-            stats = PlayerStats(user_id=user_id)
-            self.db.add(stats)
-            await self.db.flush()
-
-        # Update counts
-        stats.total_rounds += 1
-        if contract_bid == 0:
-            stats.zeros_attempted += 1
-            if tricks_won == 0:
-                stats.zeros_made += 1
-        else:
-            stats.contracts_attempted += 1
-            if tricks_won == contract_bid:
-                stats.contracts_made += 1
-
-        # Update score tracking
-        stats.total_points += round_score
-        if round_score > stats.highest_round_score:
-            stats.highest_round_score = round_score
-        if stats.lowest_score == 0 or round_score < stats.lowest_score:
-            stats.lowest_score = round_score
-
-        # Update trump wins
-        if is_trump_winner:
-            stats.trump_wins += 1
-
-        # Update streak (simplified - only tracks made contracts)
-        if tricks_won == contract_bid and contract_bid > 0:
-            stats.current_streak += 1
-            if stats.current_streak > stats.best_streak:
-                stats.best_streak = stats.current_streak
-        else:
-            stats.current_streak = 0
+
+    async def update_players_stats_after_round(
+        self,
+        updates: Sequence[RoundStatsUpdate],
+    ) -> None:
+        """Update statistics for every player of a completed round.
+
+        All players are updated by one UPDATE statement whose per-player
+        deltas are selected with CASE on user_id, so a round costs one
+        round trip regardless of player count and concurrent rounds for
+        the same player cannot lose increments.
+
+        Args:
+            updates: One entry per player in the round
+        """
+        if not updates:
+            return
+
+        result = await self.db.execute(
+            _round_stats_update(updates).returning(PlayerStats.user_id)
+        )
+        updated = {str(uid) for uid in result.scalars()}
+        missing = [u for u in updates if str(u.user_id) not in updated]
+        if missing:
+            # First round for some players: create their rows, then apply.
+            # ON CONFLICT skips rows created concurrently by another request.
+            await self.db.execute(
+                insert(PlayerStats)
+                .values([{"user_id": u.user_id} for u in missing])
+                .on_conflict_do_nothing(index_elements=["user_id"])
+            )
+            await self.db.execute(_round_stats_update(missing))
 
         await self.db.commit()
 
-        # Invalidate player cache
-        cache_key = f"player_stats:{user_id}"
-        await self.redis.delete(cache_key)
+        # Invalidate player caches
+        await self.redis.delete(*(f"player_stats:{u.user_id}" for u in updates))
@@ -71,8 +71,9 @@ class AuthService:
             last_active=datetime.now(),
         )
         self.db.add(user)
-        await self.db.commit()  # Ensure user is persisted to database
-        await self.db.refresh(user)  # Refresh to get database defaults (created_at, id, etc)
+        # Eager defaults fetch created_at/updated_at via RETURNING on the
+        # INSERT itself, so no refresh SELECT is needed afterwards
+        await self.db.commit()
 
         # Generate tokens
         access_token = create_access_token(str(user.id))
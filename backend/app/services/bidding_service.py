@@ -1,8 +1,8 @@
 """Bidding service for Trump and Contract bidding logic."""
-import json
 import logging
 from typing import Any
 
+import orjson
 from redis.asyncio import Redis  # type: ignore[import-untyped]
 
 from app.schemas.game import (
@@ -10,19 +10,11 @@ from app.schemas.game import (
     RoundPhase,
     TrumpSuit,
 )
+from app.services.room_keys import ROOM_TTL_SECONDS, room_keys
 from app.services.scoring_service import ScoringService
 
 logger = logging.getLogger(__name__)
 
-# Trump suit ordering for comparing bids of same amount
-SUIT_ORDER = {
-    TrumpSuit.CLUBS: 0,
-    TrumpSuit.DIAMONDS: 1,
-    TrumpSuit.HEARTS: 2,
-    TrumpSuit.SPADES: 3,
-    TrumpSuit.NO_TRUMP: 4,
-}
-
 # Minimum bid progression based on frisch count
 MINIMUM_BID_PROGRESSION = [5, 6, 7, 8]  # Index = frisch_count
 
@@ -39,6 +31,17 @@ class BiddingService:
         self.redis = redis
         self.scoring_service = ScoringService()
 
+    async def _hset_with_ttl(self, key: str, mapping: dict[str, Any]) -> None:
+        """Write room bidding state and give the key the full room TTL.
+
+        The room's sparse TTL refresh only reaches keys that already exist,
+        so a hash created here must set its own expiry in the same round trip.
+        """
+        pipe = self.redis.pipeline()
+        pipe.hset(key, mapping=mapping)
+        pipe.expire(key, ROOM_TTL_SECONDS)
+        await pipe.execute()
+
     def get_minimum_bid(self, frisch_count: int) -> int:
         """Get the minimum bid based on frisch count.
 
@@ -81,7 +84,7 @@ class BiddingService:
             2. If no previous bid: any bid >= minimum is valid
             3. If previous bid exists: must bid HIGHER (any of):
                - amount > previous.amount, OR
-               - amount == previous.amount AND suit > previous.suit (by SUIT_ORDER)
+               - amount == previous.amount AND suit > previous.suit (by TrumpSuit.rank)
         """
         # Rule 1: Check minimum bid
         if new_bid_amount < minimum_bid:
@@ -105,12 +108,7 @@ class BiddingService:
             if current_highest.suit is None:
                 return False, "Cannot bid without a suit"
 
-            current_suit_order = SUIT_ORDER.get(
-                TrumpSuit(current_highest.suit), -1
-            )
-            new_suit_order = SUIT_ORDER.get(new_bid_suit, -1)
-
-            if new_suit_order > current_suit_order:
+            if new_bid_suit > current_highest.suit:
                 return True, None
 
             return (
@@ -150,7 +148,7 @@ class BiddingService:
             - Resets consecutive_passes to 0
             - Updates current_bidder for next player
         """
-        round_key = f"room:{room_code}:round"
+        round_key = room_keys(room_code).round
 
         try:
             # Get current round state
@@ -167,7 +165,7 @@ class BiddingService:
             highest_bid_json = round_data.get("highest_bid")
             current_highest = None
             if highest_bid_json:
-                bid_data = json.loads(highest_bid_json)
+                bid_data = orjson.loads(highest_bid_json)
                 current_highest = BidInfo(**bid_data)
 
             # Get minimum bid
@@ -190,9 +188,9 @@ class BiddingService:
             )
 
             # Update round state
-            await self.redis.hset(
+            await self._hset_with_ttl(
                 round_key,
-                mapping={
+                {
                     "highest_bid": new_bid.model_dump_json(),
                     "consecutive_passes": 0,
                 },
@@ -218,7 +216,7 @@ class BiddingService:
             - Increments consecutive_passes
             - Updates current_bidder for next player
         """
-        round_key = f"room:{room_code}:round"
+        round_key = room_keys(room_code).round
 
         try:
             # Get current round state
@@ -235,9 +233,9 @@ class BiddingService:
             current_passes = int(round_data.get("consecutive_passes", 0))
             new_passes = current_passes + 1
 
-            await self.redis.hset(
+            await self._hset_with_ttl(
                 round_key,
-                mapping={"consecutive_passes": new_passes},
+                {"consecutive_passes": new_passes},
             )
 
             return True, None
@@ -260,7 +258,7 @@ class BiddingService:
             - Resets minimum_bid based on frisch_count
             - Resets highest_bid and consecutive_passes
         """
-        round_key = f"room:{room_code}:round"
+        round_key = room_keys(room_code).round
 
         try:
             # Get current round state
@@ -280,9 +278,9 @@ class BiddingService:
             new_minimum_bid = self.get_minimum_bid(new_frisch_count)
 
             # Reset bidding state for frisch
-            await self.redis.hset(
+            await self._hset_with_ttl(
                 round_key,
-                mapping={
+                {
                     "frisch_count": new_frisch_count,
                     "minimum_bid": new_minimum_bid,
                     "highest_bid": "",
@@ -320,12 +318,12 @@ class BiddingService:
             - Updates trump_suit, trump_winner_id, trump_winner_name, trump_winning_bid
             - Transitions phase to contract_bidding
         """
-        round_key = f"room:{room_code}:round"
+        round_key = room_keys(room_code).round
 
         try:
-            await self.redis.hset(
+            await self._hset_with_ttl(
                 round_key,
-                mapping={
+                {
                     "trump_suit": trump_suit.value,
                     "trump_winner_id": trump_winner_id,
                     "trump_winner_name": trump_winner_name,
@@ -386,8 +384,8 @@ class BiddingService:
             - Records the contract bid for this player
             - Updates current_bidder for next player
         """
-        round_key = f"room:{room_code}:round"
-        contracts_key = f"room:{room_code}:contracts"
+        round_key = room_keys(room_code).round
+        contracts_key = room_keys(room_code).contracts
 
         try:
             # Get current round state
@@ -401,7 +399,7 @@ class BiddingService:
                 return False, "Not your turn"
 
             # Store contract bid
-            await self.redis.hset(contracts_key, user_id, bid_amount)
+            await self._hset_with_ttl(contracts_key, {user_id: bid_amount})
 
             return True, None
 
@@ -418,7 +416,7 @@ class BiddingService:
         Returns:
             Sum of contract bids
         """
-        contracts_key = f"room:{room_code}:contracts"
+        contracts_key = room_keys(room_code).contracts
 
         try:
             contracts = await self.redis.hgetall(contracts_key)
@@ -435,7 +433,7 @@ class BiddingService:
         Returns:
             Dict of user_id -> bid_amount
         """
-        contracts_key = f"room:{room_code}:contracts"
+        contracts_key = room_keys(room_code).contracts
 
         try:
             contracts = await self.redis.hgetall(contracts_key)
@@ -449,5 +447,5 @@ class BiddingService:
         Args:
             room_code: Room code
         """
-        contracts_key = f"room:{room_code}:contracts"
-        await self.redis.delete(contracts_key)
+        contracts_key = room_keys(room_code).contracts
+        await self.redis.unlink(contracts_key)
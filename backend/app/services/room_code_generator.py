@@ -3,11 +3,17 @@ import secrets
 
 from redis.asyncio import Redis  # type: ignore
 
+from app.services.room_keys import room_keys
+
 # Characters for room codes: no ambiguous characters (0/O, 1/I/L, etc.)
 ROOM_CODE_CHARS = "23456789ABCDEFGHJKMNPQRSTUVWXYZ"
 ROOM_CODE_LENGTH = 6
 MAX_RETRIES = 100
 
+# Largest multiple of len(ROOM_CODE_CHARS) that fits in a byte; bytes at or
+# above it are rejected so the modulo mapping stays uniform.
+_BYTE_ACCEPT_LIMIT = 256 - 256 % len(ROOM_CODE_CHARS)
+
 
 def generate_room_code() -> str:
     """Generate a random 6-character room code.
@@ -15,10 +21,20 @@ def generate_room_code() -> str:
     Uses uppercase alphanumeric characters excluding ambiguous ones (0, 1, I, L, O).
     Format: 6 random characters from ROOM_CODE_CHARS
 
+    Entropy is drawn in one secrets.token_bytes() call per attempt rather
+    than one secrets.choice() call per character.
+
     Returns:
         6-character uppercase room code (e.g., 'ABC123')
     """
-    return "".join(secrets.choice(ROOM_CODE_CHARS) for _ in range(ROOM_CODE_LENGTH))
+    chars: list[str] = []
+    while len(chars) < ROOM_CODE_LENGTH:
+        chars.extend(
+            ROOM_CODE_CHARS[b % len(ROOM_CODE_CHARS)]
+            for b in secrets.token_bytes(ROOM_CODE_LENGTH)
+            if b < _BYTE_ACCEPT_LIMIT
+        )
+    return "".join(chars[:ROOM_CODE_LENGTH])
 
 
 async def get_unique_room_code(redis: Redis) -> str:  # type: ignore
@@ -40,7 +56,7 @@ async def get_unique_room_code(redis: Redis) -> str:  # type: ignore
         room_code = generate_room_code()
 
         # Check if room code already exists in Redis
-        if not await redis.exists(f"room:{room_code}"):
+        if not await redis.exists(room_keys(room_code).meta):
             return room_code
 
     raise RuntimeError(
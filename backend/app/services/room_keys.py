@@ -0,0 +1,101 @@
+"""Redis key names and sparse TTL refresh for room state."""
+import time
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+# Lifetime of room state after the last activity
+ROOM_TTL = timedelta(hours=24)
+ROOM_TTL_SECONDS = int(ROOM_TTL.total_seconds())
+
+# Skip a refresh when it would extend the deadline by less than this
+REFRESH_THRESHOLD = timedelta(minutes=5)
+_REFRESH_THRESHOLD_SECONDS = int(REFRESH_THRESHOLD.total_seconds())
+
+# Prune expired entries once the cache grows past this many rooms
+_MAX_TRACKED_ROOMS = 10_000
+
+# room_code -> absolute expiry (epoch seconds) last set by this process
+_deadlines: dict[str, int] = {}
+
+
+class RoomKeys(NamedTuple):
+    """Redis keys holding one room's state."""
+
+    meta: str
+    players: str
+    round: str
+    bidding: str
+    contracts: str
+    sockets: str
+
+
+@lru_cache(maxsize=4096)
+def room_keys(room_code: str) -> RoomKeys:
+    """Build (once per room) the Redis key names for a room code."""
+    return RoomKeys(
+        meta=f"room:{room_code}",
+        players=f"room:{room_code}:players",
+        round=f"room:{room_code}:round",
+        bidding=f"room:{room_code}:bidding",
+        contracts=f"room:{room_code}:contracts",
+        sockets=f"ws:room:{room_code}",
+    )
+
+
+def queue_room_ttl_refresh(
+    pipe: Any,
+    room_code: str,
+    ttl_seconds: int,
+    *,
+    force: bool = False,
+) -> bool:
+    """Queue EXPIREAT on all room keys unless the deadline is still fresh.
+
+    The deadline last written by this process is cached per room; while
+    pushing it forward would gain less than ``REFRESH_THRESHOLD`` no
+    commands are queued. Keys only ever get later deadlines, so skipping
+    is safe across processes.
+
+    EXPIREAT has no effect on keys that don't exist yet, so a skipped
+    refresh cannot cover a key created since the last one: every write
+    that may create a room key must also queue ``EXPIRE key
+    ROOM_TTL_SECONDS`` itself (now + TTL is never earlier than a cached
+    deadline, so this cannot shorten the room's life).
+
+    Args:
+        pipe: Redis pipeline to queue commands on
+        room_code: Room code
+        ttl_seconds: Lifetime to extend the room keys to
+        force: Always queue the refresh (e.g. on room creation)
+
+    Returns:
+        True if EXPIREAT commands were queued
+    """
+    deadline = int(time.time()) + ttl_seconds
+    cached = _deadlines.get(room_code)
+    if (
+        not force
+        and cached is not None
+        and deadline - cached < _REFRESH_THRESHOLD_SECONDS
+    ):
+        return False
+
+    for key in room_keys(room_code):
+        pipe.expireat(key, deadline)
+
+    if len(_deadlines) >= _MAX_TRACKED_ROOMS:
+        _prune_expired()
+    _deadlines[room_code] = deadline
+    return True
+
+
+def forget_room(room_code: str) -> None:
+    """Drop the cached deadline for a deleted room."""
+    _deadlines.pop(room_code, None)
+
+
+def _prune_expired() -> None:
+    now = time.time()
+    for room_code in [code for code, dl in _deadlines.items() if dl <= now]:
+        del _deadlines[room_code]
@@ -1,12 +1,14 @@
 """Room service for game room management."""
-import json
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Any
 from uuid import UUID
 
+import orjson
 from redis.asyncio import Redis  # type: ignore
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.clock import utc_now_iso
 from app.core.exceptions import (
     AuthorizationError,
     ConflictError,
@@ -27,13 +29,19 @@ from app.schemas.room import (
     UpdateSeatingRequest,
 )
 from app.services.room_code_generator import get_unique_room_code
+from app.services.room_keys import (
+    ROOM_TTL,
+    ROOM_TTL_SECONDS,
+    queue_room_ttl_refresh,
+    room_keys,
+)
 from app.websocket.schemas import PlayerInfo
 
 
 class RoomService:
     """Service for game room creation and management."""
 
-    ROOM_TTL = timedelta(hours=24)
+    ROOM_TTL = ROOM_TTL
     WS_ENDPOINT = "ws://localhost:8000/ws/rooms"  # Should come from config
 
     def __init__(self, db: AsyncSession, redis: Redis) -> None:  # type: ignore
@@ -99,11 +107,11 @@ class RoomService:
         await self.db.flush()
 
         # Initialize room in Redis
-        now = datetime.utcnow().isoformat()
+        now = utc_now_iso()
         pipe = self.redis.pipeline()
 
         pipe.hset(
-            f"room:{room_code}",
+            room_keys(room_code).meta,
             mapping={
                 "game_id": str(game.id),
                 "admin_id": str(current_user.id),
@@ -113,7 +121,6 @@ class RoomService:
                 "last_activity": now,
             },
         )
-        pipe.expire(f"room:{room_code}", int(self.ROOM_TTL.total_seconds()))
 
         # Initialize players hash with admin
         admin_player_info = PlayerInfo(
@@ -124,12 +131,13 @@ class RoomService:
             is_connected=False,  # Will be set to True when WebSocket connects
             avatar_url=current_user.avatar_url,
         )
-        pipe.delete(f"room:{room_code}:players")
+        pipe.unlink(room_keys(room_code).players)
         pipe.hset(
-            f"room:{room_code}:players",
+            room_keys(room_code).players,
             "0",
-            admin_player_info.model_dump_json(),
+            admin_player_info.to_redis(),
         )
+        queue_room_ttl_refresh(pipe, room_code, ROOM_TTL_SECONDS, force=True)
 
         await pipe.execute()
 
@@ -153,29 +161,31 @@ class RoomService:
         Raises:
             NotFoundError: If room does not exist
         """
-        # Get room data from Redis
-        room_data = await self.redis.hgetall(f"room:{room_code}")
-
-        if not room_data:
+        # Get room data and players from Redis in one round trip
+        keys = room_keys(room_code)
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hmget(keys.meta, ["game_id", "admin_id", "status", "created_at"])
+        pipe.hgetall(keys.players)
+        room_fields, players_data = await pipe.execute()
+
+        if any(value is None for value in room_fields):
             raise NotFoundError("Room not found", ErrorCode.ROOM_NOT_FOUND)
-
-        # Get players from Redis
-        players_data = await self.redis.hgetall(f"room:{room_code}:players")
+        game_id, admin_id, status, created_at = room_fields
 
         players: list[PlayerInRoom] = []
         for seat in range(4):
             player_json = players_data.get(str(seat))
             if player_json:
-                player_dict = json.loads(player_json)
+                player_dict = orjson.loads(player_json)
                 players.append(PlayerInRoom(**player_dict))
 
         return RoomState(
             room_code=room_code,
-            game_id=UUID(room_data["game_id"]),
-            admin_id=UUID(room_data["admin_id"]),
-            status=room_data["status"],
+            game_id=UUID(game_id),
+            admin_id=UUID(admin_id),
+            status=status,
             players=players,
-            created_at=datetime.fromisoformat(room_data["created_at"]),
+            created_at=datetime.fromisoformat(created_at),
             current_round=None,
         )
 
@@ -203,12 +213,10 @@ class RoomService:
             ConflictError: If room is full or player already in room
         """
         # Verify room exists
-        room_data = await self.redis.hgetall(f"room:{room_code}")
-        if not room_data:
-            raise NotFoundError("Room not found", ErrorCode.ROOM_NOT_FOUND)
+        (raw_game_id,) = await self._get_room_fields(room_code, "game_id")
 
         # Check if player already in room
-        game_id = UUID(room_data["game_id"])
+        game_id = UUID(raw_game_id)
         result = await self.db.execute(
             select(GamePlayer).where(
                 (GamePlayer.game_id == game_id)
@@ -223,7 +231,7 @@ class RoomService:
         if existing_player:
             # Player exists in DB - check if they're still in Redis (active)
             redis_player = await self.redis.hget(
-                f"room:{room_code}:players",
+                room_keys(room_code).players,
                 str(existing_player.seat_position),
             )
             if redis_player:
@@ -275,12 +283,14 @@ class RoomService:
             avatar_url=current_user.avatar_url,
         )
 
-        await self.redis.hset(
-            f"room:{room_code}:players",
+        pipe = self.redis.pipeline()
+        pipe.hset(
+            room_keys(room_code).players,
             str(available_seat),
-            player_info.model_dump_json(),
+            player_info.to_redis(),
         )
-        await self._refresh_ttl(room_code)
+        self._queue_ttl_refresh(pipe, room_code)
+        await pipe.execute()
 
         # Return room state
         room_state = await self.get_room(room_code)
@@ -305,11 +315,9 @@ class RoomService:
             NotFoundError: If room doesn't exist
         """
         # Verify room exists
-        room_data = await self.redis.hgetall(f"room:{room_code}")
-        if not room_data:
-            raise NotFoundError("Room not found", ErrorCode.ROOM_NOT_FOUND)
+        (raw_game_id,) = await self._get_room_fields(room_code, "game_id")
 
-        game_id = UUID(room_data["game_id"])
+        game_id = UUID(raw_game_id)
 
         # Remove from database
         result = await self.db.execute(
@@ -326,8 +334,10 @@ class RoomService:
 
             # Remove from Redis
             seat = game_player.seat_position
-            await self.redis.hdel(f"room:{room_code}:players", str(seat))
-            await self._refresh_ttl(room_code)
+            pipe = self.redis.pipeline()
+            pipe.hdel(room_keys(room_code).players, str(seat))
+            self._queue_ttl_refresh(pipe, room_code)
+            await pipe.execute()
 
     async def update_seating(
         self,
@@ -353,18 +363,18 @@ class RoomService:
             ValidationError: If seating list is invalid
         """
         # Get room
-        room_data = await self.redis.hgetall(f"room:{room_code}")
-        if not room_data:
-            raise NotFoundError("Room not found", ErrorCode.ROOM_NOT_FOUND)
+        raw_admin_id, raw_game_id = await self._get_room_fields(
+            room_code, "admin_id", "game_id"
+        )
 
-        admin_id = UUID(room_data["admin_id"])
+        admin_id = UUID(raw_admin_id)
 
         # Check authorization
         if current_user.id != admin_id:
             raise AuthorizationError("Only the room admin can update seating")
 
         # Get current players
-        game_id = UUID(room_data["game_id"])
+        game_id = UUID(raw_game_id)
         result = await self.db.execute(
             select(GamePlayer)
             .where(GamePlayer.game_id == game_id)
@@ -391,24 +401,25 @@ class RoomService:
         await self.db.flush()
 
         # Update Redis
-        players_data = await self.redis.hgetall(f"room:{room_code}:players")
-        new_players_data: dict[str, str] = {}
+        players_data = await self.redis.hgetall(room_keys(room_code).players)
+        new_players_data: dict[str, bytes] = {}
 
         for player in current_players:
             player_json = players_data.get(str(player.seat_position))
             if player_json:
-                player_dict = json.loads(player_json)
+                player_dict = orjson.loads(player_json)
                 player_dict["seat_position"] = player.seat_position
-                new_players_data[str(player.seat_position)] = json.dumps(
+                new_players_data[str(player.seat_position)] = orjson.dumps(
                     player_dict
                 )
 
-        await self.redis.delete(f"room:{room_code}:players")
+        pipe = self.redis.pipeline()
+        pipe.unlink(room_keys(room_code).players)
         if new_players_data:
-            await self.redis.hset(
-                f"room:{room_code}:players", mapping=new_players_data
-            )
-        await self._refresh_ttl(room_code)
+            pipe.hset(room_keys(room_code).players, mapping=new_players_data)
+        # The players hash is recreated without a TTL, so always re-arm it
+        self._queue_ttl_refresh(pipe, room_code, force=True)
+        await pipe.execute()
 
         return await self.get_room(room_code)
 
@@ -435,17 +446,17 @@ class RoomService:
             ValidationError: If room doesn't have 4 players
         """
         # Get room
-        room_data = await self.redis.hgetall(f"room:{room_code}")
-        if not room_data:
-            raise NotFoundError("Room not found", ErrorCode.ROOM_NOT_FOUND)
+        raw_admin_id, raw_game_id = await self._get_room_fields(
+            room_code, "admin_id", "game_id"
+        )
 
-        admin_id = UUID(room_data["admin_id"])
+        admin_id = UUID(raw_admin_id)
 
         # Check authorization
         if current_user.id != admin_id:
             raise AuthorizationError("Only the room admin can start the game")
 
-        game_id = UUID(room_data["game_id"])
+        game_id = UUID(raw_game_id)
 
         # Get players and validate count
         result = await self.db.execute(
@@ -468,15 +479,17 @@ class RoomService:
         await self.db.flush()
 
         # Update Redis
-        now = datetime.utcnow().isoformat()
-        await self.redis.hset(
-            f"room:{room_code}",
+        now = utc_now_iso()
+        pipe = self.redis.pipeline()
+        pipe.hset(
+            room_keys(room_code).meta,
             mapping={
                 "status": "bidding_trump",
                 "last_activity": now,
             },
         )
-        await self._refresh_ttl(room_code)
+        self._queue_ttl_refresh(pipe, room_code)
+        await pipe.execute()
 
         # Get the first bidder (player in seat 0)
         first_bidder_result = await self.db.execute(
@@ -495,16 +508,38 @@ class RoomService:
             message="Game started",
         )
 
-    async def _refresh_ttl(self, room_code: str) -> None:
-        """Refresh TTL on all room keys.
+    async def _get_room_fields(self, room_code: str, *fields: str) -> list[str]:
+        """Fetch selected room metadata fields with a single HMGET.
 
         Args:
             room_code: Room code
+            *fields: Hash fields to fetch
+
+        Returns:
+            Field values in the order requested
+
+        Raises:
+            NotFoundError: If the room (or any requested field) is missing
         """
-        ttl_seconds = int(self.ROOM_TTL.total_seconds())
-        pipe = self.redis.pipeline()
-        pipe.expire(f"room:{room_code}", ttl_seconds)
-        pipe.expire(f"room:{room_code}:players", ttl_seconds)
-        pipe.expire(f"room:{room_code}:round", ttl_seconds)
-        pipe.expire(f"room:{room_code}:bidding", ttl_seconds)
-        await pipe.execute()
+        values = await self.redis.hmget(room_keys(room_code).meta, fields)
+        if any(value is None for value in values):
+            raise NotFoundError("Room not found", ErrorCode.ROOM_NOT_FOUND)
+        return values  # type: ignore[no-any-return]
+
+    def _queue_ttl_refresh(
+        self, pipe: Any, room_code: str, force: bool = False
+    ) -> None:
+        """Queue TTL refresh for all room keys on a pipeline.
+
+        Callers add this to the pipeline carrying their write so the
+        mutation and the TTL refresh share one round trip. The refresh
+        is skipped while the room's deadline is still fresh.
+
+        Args:
+            pipe: Redis pipeline to queue commands on
+            room_code: Room code
+            force: Refresh even if the cached deadline is still fresh
+        """
+        queue_room_ttl_refresh(
+            pipe, room_code, ROOM_TTL_SECONDS, force=force
+        )
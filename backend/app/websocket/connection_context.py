@@ -9,7 +9,7 @@ if TYPE_CHECKING:
     import socketio
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionContext:
     """
     Context for a WebSocket connection.
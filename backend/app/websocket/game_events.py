@@ -4,7 +4,6 @@ from typing import Any
 
 import socketio  # type: ignore
 
-from app.schemas.game import TrumpSuit
 from app.services.bidding_service import BiddingService
 from app.websocket.connection_context import ConnectionContext
 from app.websocket.room_manager import RoomManager
@@ -42,7 +41,7 @@ async def emit_error(
         details: Additional error details
         recoverable: Whether client can retry
     """
-    error_payload = ErrorPayload(
+    error_payload = ErrorPayload.model_construct(
         code=code,
         message=message,
         details=details,
@@ -122,7 +121,7 @@ def register_bidding_handlers(  # noqa: C901
                 ctx.user_id,
                 ctx.display_name,
                 payload.amount,
-                TrumpSuit(payload.suit),
+                payload.suit,
             )
 
             if not success:
@@ -135,16 +134,16 @@ def register_bidding_handlers(  # noqa: C901
                 return
 
             # Create bid info for broadcast
-            bid_info = BidInfo(
+            bid_info = BidInfo.model_construct(
                 player_id=ctx.user_id,
                 player_name=ctx.display_name,
                 amount=payload.amount,
-                suit=TrumpSuit(payload.suit),
+                suit=payload.suit,
                 is_pass=False,
             )
 
             # Broadcast bid to room
-            broadcast_payload = BidPlacedPayload(
+            broadcast_payload = BidPlacedPayload.model_construct(
                 bid=bid_info,
                 is_highest=True,  # TODO: Calculate actual highest
                 next_bidder_id=None,  # TODO: Determine next bidder
@@ -211,7 +210,7 @@ def register_bidding_handlers(  # noqa: C901
                 return
 
             # Broadcast pass to room
-            broadcast_payload = BidPassedPayload(
+            broadcast_payload = BidPassedPayload.model_construct(
                 player_id=ctx.user_id,
                 player_name=ctx.display_name,
                 consecutive_passes=0,  # TODO: Get actual count
@@ -280,8 +279,8 @@ def register_bidding_handlers(  # noqa: C901
 
             # Broadcast contract bid to room
             # TODO: Determine next bidder and check if all contracts are placed
-            broadcast_payload = BidPlacedPayload(
-                bid=BidInfo(
+            broadcast_payload = BidPlacedPayload.model_construct(
+                bid=BidInfo.model_construct(
                     player_id=ctx.user_id,
                     player_name=ctx.display_name,
                     amount=payload.amount,
@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import logging
+import random
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import TYPE_CHECKING, Any, Literal
 
 from redis.asyncio import Redis  # type: ignore
 
+from app.core.clock import utc_now_iso
 from app.core.exceptions import NotFoundError
 from app.schemas.errors import ErrorCode
+from app.services.room_keys import (
+    ROOM_TTL,
+    ROOM_TTL_SECONDS,
+    forget_room,
+    queue_room_ttl_refresh,
+    room_keys,
+)
 from app.websocket.schemas import (
     PlayerInfo,
     RoomPlayerLeftPayload,
@@ -20,19 +29,70 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Flip a seat's is_connected flag in place. Player blobs are compact JSON
+# written by PlayerInfo.to_redis(), so the flag is patched textually
+# instead of decoded. KEYS[1] = players hash, ARGV = seat, "true"/"false".
+SET_PLAYER_CONNECTED_LUA = """
+local blob = redis.call('HGET', KEYS[1], ARGV[1])
+if not blob then
+    return 0
+end
+local patched, count = string.gsub(
+    blob, '"is_connected":%a+', '"is_connected":' .. ARGV[2], 1
+)
+if count == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], patched)
+return 1
+"""
+
+# Delete ws:user:{id} only while it still points at the given socket, so
+# a stale disconnect cannot drop the pointer to a newer connection.
+# KEYS[1] = ws:user:{id}, ARGV[1] = socket id.
+RELEASE_USER_SOCKET_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('UNLINK', KEYS[1])
+end
+return 0
+"""
+
 
 def _normalize_redis_hash(data: dict) -> dict[str, str]:
     """Normalize Redis hash data to string keys and values.
 
     Redis can return either bytes or strings depending on client configuration.
-    This function normalizes to string keys and values.
+    This function normalizes to string keys and values. A client decodes
+    either every reply or none, so when the first entry is already str the
+    hash is returned as-is without a per-field pass.
     """
-    result = {}
-    for k, v in data.items():
-        key = k.decode() if isinstance(k, bytes) else k
-        value = v.decode() if isinstance(v, bytes) else v
-        result[key] = value
-    return result
+    if not data:
+        return data
+    first_key, first_value = next(iter(data.items()))
+    if type(first_key) is str and type(first_value) is str:
+        return data
+    return {
+        (k.decode() if type(k) is bytes else k): (
+            v.decode() if type(v) is bytes else v
+        )
+        for k, v in data.items()
+    }
+
+
+def _decode(value: bytes | str) -> str:
+    """Return a Redis reply value as str."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _parse_players(players_data: dict) -> list[PlayerInfo]:
+    """Parse a players hash into PlayerInfo objects sorted by seat."""
+    players = [PlayerInfo.model_validate_json(data) for data in players_data.values()]
+    return sorted(players, key=lambda p: p.seat_position)
+
+
+def _find_player(players: list[PlayerInfo], user_id: str) -> PlayerInfo | None:
+    """Return the player with the given user ID, if seated."""
+    return next((p for p in players if p.user_id == user_id), None)
 
 
 @dataclass
@@ -66,8 +126,13 @@ class RoomManager:
     - Room state synchronization
     """
 
-    ROOM_TTL = timedelta(hours=24)
+    ROOM_TTL = ROOM_TTL
     RECONNECT_GRACE_PERIOD = timedelta(seconds=60)
+    RECONNECT_GRACE_SECONDS = int(RECONNECT_GRACE_PERIOD.total_seconds())
+    # Socket tracking keys live ~10 minutes; jitter spreads their expiry
+    # so sockets tracked in the same burst don't all expire together
+    WS_KEY_TTL_SECONDS = 600
+    WS_KEY_TTL_JITTER_SECONDS = 60
 
     def __init__(
         self,
@@ -82,6 +147,8 @@ class RoomManager:
         """
         self.redis = redis
         self.db_session_factory = db_session_factory
+        self._set_player_connected = redis.register_script(SET_PLAYER_CONNECTED_LUA)
+        self._release_user_socket = redis.register_script(RELEASE_USER_SOCKET_LUA)
 
     async def join_room(
         self,
@@ -108,16 +175,23 @@ class RoomManager:
         """
         room_code = room_code.upper()
 
-        # Check room exists
-        raw_room_data = await self.redis.hgetall(f"room:{room_code}")
-        if not raw_room_data:
+        # Fetch the room fields we need and the players in one round trip
+        keys = room_keys(room_code)
+        required_keys = ("game_id", "admin_id", "status")
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.hmget(keys.meta, required_keys)
+        pipe.hgetall(keys.players)
+        pipe.smembers(keys.sockets)
+        raw_values, players_data, socket_ids = await pipe.execute()
+        if all(value is None for value in raw_values):
             raise NotFoundError("Room not found", ErrorCode.ROOM_NOT_FOUND)
 
         # Normalize to string keys/values
-        room_data = _normalize_redis_hash(raw_room_data)
+        room_data = _normalize_redis_hash(
+            {k: v for k, v in zip(required_keys, raw_values) if v is not None}
+        )
 
         # Validate room data has required fields
-        required_keys = ["game_id", "admin_id", "status"]
         missing_keys = [k for k in required_keys if k not in room_data]
         if missing_keys:
             logger.error(
@@ -128,24 +202,25 @@ class RoomManager:
             )
             raise NotFoundError("Room data is corrupted", ErrorCode.ROOM_NOT_FOUND)
 
-        # Get players
-        players = await self._get_room_players(room_code)
+        # The seat lookup and the result reuse this single read of players
+        players = _parse_players(players_data)
+        dead_socket_ids = await self._find_dead_sockets(socket_ids)
 
         # Check if player already in room BEFORE checking if room is full
         # (player might be the 4th player who joined via REST API)
-        existing_seat = await self._find_player_seat(room_code, user_id)
-        if existing_seat is not None:
+        existing = _find_player(players, user_id)
+        if existing is not None:
             # Already in room, just update connection
             await self._update_player_connection(
-                room_code, user_id, socket_id, existing_seat
+                room_code, user_id, socket_id, existing.seat_position, dead_socket_ids
             )
-            players = await self._get_room_players(room_code)
+            player_info = existing.model_copy(update={"is_connected": True})
             return JoinRoomResult(
                 game_id=room_data["game_id"],
-                seat_position=existing_seat,
+                seat_position=existing.seat_position,
                 is_admin=room_data["admin_id"] == user_id,
-                players=players,
-                player_info=next(p for p in players if p.seat_position == existing_seat),
+                players=[player_info if p is existing else p for p in players],
+                player_info=player_info,
                 phase=room_data["status"],
                 current_round=None,
             )
@@ -168,18 +243,22 @@ class RoomManager:
             is_connected=True,
         )
 
-        await self.redis.hset(
-            f"room:{room_code}:players",
+        # Seat the player, track the socket and refresh TTLs in one round trip
+        pipe = self.redis.pipeline()
+        pipe.hset(
+            keys.players,
             str(available_seat),
-            player_info.model_dump_json(),
+            player_info.to_redis(),
         )
+        self._queue_track_connection(pipe, socket_id, user_id, room_code)
+        if dead_socket_ids:
+            pipe.srem(keys.sockets, *dead_socket_ids)
+        self._queue_room_ttl_refresh(pipe, room_code)
+        await pipe.execute()
 
-        # Track socket connection
-        await self._track_connection(socket_id, user_id, room_code)
-        await self._refresh_room_ttl(room_code)
-
-        # Get updated player list
-        updated_players = await self._get_room_players(room_code)
+        updated_players = sorted(
+            [*players, player_info], key=lambda p: p.seat_position
+        )
 
         return JoinRoomResult(
             game_id=room_data["game_id"],
@@ -212,30 +291,27 @@ class RoomManager:
         """
         room_code = room_code.upper()
 
-        # Find player's seat
-        seat = await self._find_player_seat(room_code, user_id)
-        if seat is None:
+        # Find player's seat and info from a single read
+        players = await self._get_room_players(room_code)
+        player_info = _find_player(players, user_id)
+        if player_info is None:
             raise NotFoundError("Player not in room", ErrorCode.PLAYER_NOT_IN_ROOM)
 
-        # Get player info before removal
-        player_data = await self.redis.hget(
-            f"room:{room_code}:players",
-            str(seat),
-        )
-        player_info = PlayerInfo.model_validate_json(player_data)  # type: ignore[arg-type]
-
-        # Remove player
-        await self.redis.hdel(f"room:{room_code}:players", str(seat))
+        # Remove player, fetching their socket and the remaining count
+        pipe = self.redis.pipeline()
+        pipe.hdel(room_keys(room_code).players, str(player_info.seat_position))
+        pipe.get(f"ws:user:{user_id}")
+        pipe.hlen(room_keys(room_code).players)
+        _, socket_id, remaining_count = await pipe.execute()
 
         # Clear connection tracking
-        socket_id = await self.redis.get(f"ws:user:{user_id}")
         if socket_id:
+            if isinstance(socket_id, bytes):
+                socket_id = socket_id.decode()
             await self._clear_connection(socket_id)
 
         # Check if room is now empty
-        remaining_players = await self._get_room_players(room_code)
-
-        if not remaining_players:
+        if not remaining_count:
             # Room is empty, clean up
             await self._delete_room(room_code)
             return LeaveRoomResult(
@@ -244,11 +320,11 @@ class RoomManager:
             )
 
         # Room still has players
-        broadcast_payload = RoomPlayerLeftPayload(
+        broadcast_payload = RoomPlayerLeftPayload.model_construct(
             player_id=user_id,
             player_name=player_info.display_name,
             reason=reason,
-            player_count=len(remaining_players),
+            player_count=remaining_count,
         )
 
         return LeaveRoomResult(
@@ -288,9 +364,10 @@ class RoomManager:
             return None, None
 
         # Get room phase
-        raw_room_data = await self.redis.hgetall(f"room:{room_code_str}")
-        room_data = _normalize_redis_hash(raw_room_data) if raw_room_data else {}
-        phase = room_data.get("status", "waiting")
+        raw_phase = await self.redis.hget(room_keys(room_code_str).meta, "status")
+        if isinstance(raw_phase, bytes):
+            raw_phase = raw_phase.decode()
+        phase = raw_phase or "waiting"
 
         if phase == "waiting":
             # Game hasn't started, just remove player
@@ -306,12 +383,8 @@ class RoomManager:
 
     async def _get_room_players(self, room_code: str) -> list[PlayerInfo]:
         """Get all players in a room."""
-        players_data = await self.redis.hgetall(f"room:{room_code}:players")
-        players = []
-        for _seat, data in players_data.items():
-            player = PlayerInfo.model_validate_json(data)
-            players.append(player)
-        return sorted(players, key=lambda p: p.seat_position)
+        players_data = await self.redis.hgetall(room_keys(room_code).players)
+        return _parse_players(players_data)
 
     async def _find_player_seat(
         self,
@@ -319,58 +392,80 @@ class RoomManager:
         user_id: str,
     ) -> int | None:
         """Find a player's seat in a room."""
-        players_data = await self.redis.hgetall(f"room:{room_code}:players")
+        players_data = await self.redis.hgetall(room_keys(room_code).players)
         for seat, data in players_data.items():
             player = PlayerInfo.model_validate_json(data)
             if player.user_id == user_id:
                 return int(seat)
         return None
 
-    async def _track_connection(
+    def _queue_track_connection(
         self,
+        pipe: Any,
         socket_id: str,
         user_id: str,
         room_code: str,
     ) -> None:
-        """Track WebSocket connection."""
-        pipe = self.redis.pipeline()
-
+        """Queue WebSocket connection tracking on a pipeline."""
+        ttl = self.WS_KEY_TTL_SECONDS + random.randint(
+            -self.WS_KEY_TTL_JITTER_SECONDS, self.WS_KEY_TTL_JITTER_SECONDS
+        )
         pipe.hset(
             f"ws:socket:{socket_id}",
             mapping={
                 "user_id": user_id,
                 "room_code": room_code,
-                "connected_at": datetime.utcnow().isoformat(),
+                "connected_at": utc_now_iso(),
             },
         )
-        pipe.expire(f"ws:socket:{socket_id}", 600)  # 10 minutes
-
-        pipe.set(f"ws:user:{user_id}", socket_id)
-        pipe.expire(f"ws:user:{user_id}", 600)
+        pipe.expire(f"ws:socket:{socket_id}", ttl)
 
-        pipe.sadd(f"ws:room:{room_code}", socket_id)
+        pipe.set(f"ws:user:{user_id}", socket_id, ex=ttl)
 
-        await pipe.execute()
+        # The sparse room TTL refresh skips keys created since the last one,
+        # so the socket set gets its expiry whenever it may be created
+        sockets_key = room_keys(room_code).sockets
+        pipe.sadd(sockets_key, socket_id)
+        pipe.expire(sockets_key, ROOM_TTL_SECONDS)
 
     async def _clear_connection(self, socket_id: str) -> None:
-        """Clear WebSocket connection tracking."""
-        raw_conn_data = await self.redis.hgetall(f"ws:socket:{socket_id}")
-
-        if raw_conn_data:
-            conn_data = _normalize_redis_hash(raw_conn_data)
-            user_id = conn_data.get("user_id")
-            room_code = conn_data.get("room_code")
-
-            pipe = self.redis.pipeline()
-            pipe.delete(f"ws:socket:{socket_id}")
+        """Clear WebSocket connection tracking.
 
-            if user_id:
-                pipe.delete(f"ws:user:{user_id}")
+        The related keys are named by the socket's tracking hash, so it is
+        read first; the writes then go out in one pipeline with every key
+        passed explicitly (the user pointer via a single-key script).
+        """
+        socket_key = f"ws:socket:{socket_id}"
+        user_id, room_code = await self.redis.hmget(socket_key, "user_id", "room_code")
+        if user_id is None and room_code is None:
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.unlink(socket_key)
+        if user_id is not None:
+            await self._release_user_socket(
+                keys=[f"ws:user:{_decode(user_id)}"],
+                args=[socket_id],
+                client=pipe,
+            )
+        if room_code is not None:
+            pipe.srem(room_keys(_decode(room_code)).sockets, socket_id)
+        await pipe.execute()
 
-            if room_code:
-                pipe.srem(f"ws:room:{room_code}", socket_id)
+    async def _find_dead_sockets(self, socket_ids: set[Any]) -> list[str]:
+        """Return socket IDs whose ws:socket hash has expired.
 
-            await pipe.execute()
+        Catches sockets whose cleanup was skipped (e.g. a worker crash).
+        Rooms hold a handful of sockets, so one pipelined EXISTS each is cheap.
+        """
+        if not socket_ids:
+            return []
+        candidates = [_decode(sid) for sid in socket_ids]
+        pipe = self.redis.pipeline(transaction=False)
+        for sid in candidates:
+            pipe.exists(f"ws:socket:{sid}")
+        alive = await pipe.execute()
+        return [sid for sid, exists in zip(candidates, alive) if not exists]
 
     async def _update_player_connection(
         self,
@@ -378,22 +473,19 @@ class RoomManager:
         user_id: str,
         socket_id: str,
         seat_position: int,
+        dead_socket_ids: list[str],
     ) -> None:
-        """Update player connection status."""
-        player_data = await self.redis.hget(
-            f"room:{room_code}:players",
-            str(seat_position),
+        """Update player connection status and drop expired socket IDs."""
+        pipe = self.redis.pipeline()
+        await self._set_player_connected(
+            keys=[room_keys(room_code).players],
+            args=[str(seat_position), "true"],
+            client=pipe,
         )
-        if player_data:
-            player = PlayerInfo.model_validate_json(player_data)  # type: ignore
-            updated = player.model_copy(update={"is_connected": True})
-            await self.redis.hset(
-                f"room:{room_code}:players",
-                str(seat_position),
-                updated.model_dump_json(),
-            )
-
-        await self._track_connection(socket_id, user_id, room_code)
+        self._queue_track_connection(pipe, socket_id, user_id, room_code)
+        if dead_socket_ids:
+            pipe.srem(room_keys(room_code).sockets, *dead_socket_ids)
+        await pipe.execute()
 
     async def _mark_player_disconnected(
         self,
@@ -403,68 +495,52 @@ class RoomManager:
     ) -> None:
         """Mark player as disconnected with grace period."""
         # Update player connection status
-        player_data = await self.redis.hget(
-            f"room:{room_code}:players",
-            str(seat),
+        pipe = self.redis.pipeline()
+        await self._set_player_connected(
+            keys=[room_keys(room_code).players],
+            args=[str(seat), "false"],
+            client=pipe,
         )
-        if player_data:
-            player = PlayerInfo.model_validate_json(player_data)  # type: ignore
-            updated = player.model_copy(update={"is_connected": False})
-            await self.redis.hset(
-                f"room:{room_code}:players",
-                str(seat),
-                updated.model_dump_json(),
-            )
 
         # Store reconnection info
-        await self.redis.hset(
+        pipe.hset(
             f"reconnect:{user_id}",
             mapping={
                 "room_code": room_code,
                 "seat_position": str(seat),
-                "disconnected_at": datetime.utcnow().isoformat(),
+                "disconnected_at": utc_now_iso(),
             },
         )
-        await self.redis.expire(
+        pipe.expire(
             f"reconnect:{user_id}",
-            int(self.RECONNECT_GRACE_PERIOD.total_seconds()),
+            self.RECONNECT_GRACE_SECONDS,
         )
+        await pipe.execute()
 
         logger.info(
             "Player %s marked disconnected in room %s (grace period: %ds)",
             user_id,
             room_code,
-            int(self.RECONNECT_GRACE_PERIOD.total_seconds()),
+            self.RECONNECT_GRACE_SECONDS,
         )
 
     async def _clear_reconnection(self, user_id: str) -> None:
         """Clear reconnection grace period."""
-        await self.redis.delete(f"reconnect:{user_id}")
+        await self.redis.unlink(f"reconnect:{user_id}")
 
-    async def _refresh_room_ttl(self, room_code: str) -> None:
-        """Refresh TTL on all room keys."""
-        ttl = int(self.ROOM_TTL.total_seconds())
-        pipe = self.redis.pipeline()
-        pipe.expire(f"room:{room_code}", ttl)
-        pipe.expire(f"room:{room_code}:players", ttl)
-        pipe.expire(f"room:{room_code}:round", ttl)
-        pipe.expire(f"room:{room_code}:bidding", ttl)
+    def _queue_room_ttl_refresh(self, pipe: Any, room_code: str) -> None:
+        """Queue activity timestamp and (sparse) TTL refresh onto a pipeline."""
+        queue_room_ttl_refresh(pipe, room_code, ROOM_TTL_SECONDS)
         pipe.hset(
-            f"room:{room_code}",
+            room_keys(room_code).meta,
             "last_activity",
-            datetime.utcnow().isoformat(),
+            utc_now_iso(),
         )
-        await pipe.execute()
 
     async def _delete_room(self, room_code: str) -> None:
         """Delete all room data from Redis."""
-        await self.redis.delete(
-            f"room:{room_code}",
-            f"room:{room_code}:players",
-            f"room:{room_code}:round",
-            f"room:{room_code}:bidding",
-            f"ws:room:{room_code}",
-        )
+        await self.redis.unlink(*room_keys(room_code))
+        forget_room(room_code)
         logger.info("Room %s deleted", room_code)
 
     async def is_player_in_room(self, room_code: str, user_id: str) -> bool:
@@ -474,6 +550,6 @@ class RoomManager:
 
     async def is_room_admin(self, room_code: str, user_id: str) -> bool:
         """Check if a user is the room admin."""
-        admin_id = await self.redis.hget(f"room:{room_code}", "admin_id")
+        admin_id = await self.redis.hget(room_keys(room_code).meta, "admin_id")
         # With decode_responses=True, admin_id is always a string (or None)
         return admin_id == user_id
@@ -26,20 +26,12 @@ class BasePayload(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     def to_dict(self) -> dict:
-        """Convert to dict with datetime objects serialized to ISO strings."""
-        data = self.model_dump()
-        return _serialize_datetimes(data)
+        """Convert to dict with datetime objects serialized to ISO strings.
 
-
-def _serialize_datetimes(obj: dict | list | object) -> dict | list | object:
-    """Recursively serialize datetime objects to ISO strings."""
-    if isinstance(obj, dict):
-        return {k: _serialize_datetimes(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_serialize_datetimes(item) for item in obj]
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
-    return obj
+        Uses pydantic's JSON-mode serializer so the conversion happens in
+        pydantic-core rather than a recursive Python walk per payload.
+        """
+        return self.model_dump(mode="json")
 
 
 class TimestampedPayload(BasePayload):
@@ -58,6 +50,14 @@ class PlayerInfo(TimestampedPayload):
     is_connected: bool = True
     avatar_url: str | None = None
 
+    def to_redis(self) -> str:
+        """Serialize for the room players hash.
+
+        The payload timestamp and unset fields are dropped; both are
+        restored from defaults when the blob is validated back.
+        """
+        return self.model_dump_json(exclude={"timestamp"}, exclude_none=True)
+
 
 # Client → Server Payloads
 
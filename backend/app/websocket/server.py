@@ -145,7 +145,7 @@ def register_socketio_handlers(  # noqa: C901
                 room_code, user_id = await room_manager.handle_disconnect(sid)
                 if room_code and user_id:
                     # Broadcast disconnect to room
-                    broadcast_payload = RoomPlayerDisconnectedPayload(
+                    broadcast_payload = RoomPlayerDisconnectedPayload.model_construct(
                         player_id=user_id,
                         player_name=ctx.display_name,
                         grace_period_seconds=60,
@@ -228,7 +228,7 @@ def register_socketio_handlers(  # noqa: C901
                 await ctx.emit(ServerEvents.ROOM_JOINED, joined_payload.to_dict())
 
                 # Broadcast to room
-                player_joined_payload = RoomPlayerJoinedPayload(
+                player_joined_payload = RoomPlayerJoinedPayload.model_construct(
                     player=join_result.player_info,
                     player_count=len(join_result.players),
                 )
@@ -303,7 +303,7 @@ def register_socketio_handlers(  # noqa: C901
                 ctx.current_room = None
 
                 # Send confirmation
-                left_payload = RoomLeftPayload(
+                left_payload = RoomLeftPayload.model_construct(
                     room_code=payload.room_code,
                     reason="voluntary",
                 )
@@ -355,7 +355,7 @@ async def emit_error(
         details: Additional error details
         recoverable: Whether the client can recover
     """
-    error_payload = ErrorPayload(
+    error_payload = ErrorPayload.model_construct(
         code=code,
         message=message,
         details=details,
@@ -4,7 +4,8 @@ import os
 from collections.abc import AsyncGenerator
 
 import pytest
-from httpx import AsyncClient
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 from redis.asyncio import Redis
 from sqlalchemy import JSON, TypeDecorator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
@@ -23,6 +24,9 @@ class JSONBCompat(TypeDecorator):  # type: ignore[name-defined]
     cache_ok = True
 
 
+# Minimum bcrypt cost: registration tests don't exercise hash strength
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 # Check if we're using SQLite for testing
 use_postgres = os.getenv("POSTGRES_TEST_URL") is not None
 if not use_postgres:
@@ -37,9 +41,22 @@ from app.models import Base
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> asyncio.AbstractEventLoop:
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when it is installed."""
+    try:
+        import uvloop
+
+        return uvloop.EventLoopPolicy()
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def event_loop(
+    event_loop_policy: asyncio.AbstractEventLoopPolicy,
+) -> asyncio.AbstractEventLoop:
     """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    loop = event_loop_policy.new_event_loop()
     yield loop
     loop.close()
 
@@ -131,8 +148,22 @@ async def test_user_id(test_db: AsyncSession):  # type: ignore[no-untyped-def]
     yield user_id
 
 
+@pytest.fixture(scope="session")
+def test_app() -> FastAPI:
+    """Create the FastAPI application once for the test session.
+
+    The app holds no per-test state: database and Redis are resolved
+    through db_manager/redis_manager on each request.
+    """
+    return create_app()
+
+
 @pytest.fixture
-async def client(test_db: AsyncSession, redis: Redis) -> AsyncGenerator[AsyncClient, None]:  # type: ignore[type-arg]
+async def client(
+    test_app: FastAPI,
+    test_db: AsyncSession,
+    redis: Redis,  # type: ignore[type-arg]
+) -> AsyncGenerator[AsyncClient, None]:
     """Create a test client."""
     # Import after models are patched
     from app.core.redis import redis_manager
@@ -140,6 +171,6 @@ async def client(test_db: AsyncSession, redis: Redis) -> AsyncGenerator[AsyncCli
     # Set the redis client in redis_manager for the app
     redis_manager._client = redis  # type: ignore[attr-defined]
 
-    app = create_app()
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    transport = ASGITransport(app=test_app)  # type: ignore[arg-type]
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
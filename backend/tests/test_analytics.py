@@ -2,8 +2,14 @@
 from uuid import uuid4
 
 import pytest
-
-from app.services.analytics_service import AnalyticsService
+from sqlalchemy.dialects import postgresql
+
+from app.models import PlayerStats, User  # type: ignore[attr-defined]
+from app.services.analytics_service import (
+    AnalyticsService,
+    RoundStatsUpdate,
+    _round_stats_update,
+)
 from app.services.group_service import GroupService
 
 
@@ -41,6 +47,45 @@ class TestPlayerStats:
         assert stats.total_rounds == 0
         assert stats.wins == 0
 
+    async def test_rates_are_generated_by_database(
+        self,
+        db_session,  # type: ignore[no-untyped-def]
+        test_user_id: str,
+    ) -> None:
+        """Test win_rate and average_score are computed on write."""
+        stats = PlayerStats(
+            user_id=test_user_id,
+            total_games=4,
+            total_wins=1,
+            total_points=90,
+        )
+        db_session.add(stats)
+        await db_session.flush()
+
+        assert stats.win_rate == 25.0
+        assert stats.average_score == 22.5
+
+
+def test_trump_suit_update_renders_jsonb_set() -> None:
+    """Test a trump winner's suit counter is patched in place on Postgres."""
+    winner, other = uuid4(), uuid4()
+    stmt = _round_stats_update(
+        [
+            RoundStatsUpdate(winner, 5, 5, 35, is_trump_winner=True, trump_suit="hearts"),
+            RoundStatsUpdate(other, 2, 1, -10),
+        ]
+    )
+
+    sql = str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+    assert "suit_wins=CASE WHEN (player_stats.user_id = " in sql
+    assert "jsonb_set(player_stats.suit_wins, ARRAY[$" in sql
+    assert "to_jsonb(coalesce(CAST((player_stats.suit_wins ->> $" in sql
+    assert "ELSE player_stats.suit_wins END" in sql
+
+    # Rounds without a declared trump suit leave the column alone
+    no_suit = _round_stats_update([RoundStatsUpdate(winner, 5, 5, 35, is_trump_winner=True)])
+    assert "suit_wins" not in str(no_suit.compile(dialect=postgresql.asyncpg.dialect()))
+
 
 class TestHeadToHeadStats:
     """Test head-to-head statistics."""
@@ -181,6 +226,28 @@ class TestPlayerStatsUpdate:
         stats = await analytics_service.get_player_stats(test_user_id)  # type: ignore[arg-type]
         assert stats.lowest_round_score == -30
 
+    async def test_update_stats_lowest_score_zero(
+        self,
+        analytics_service: AnalyticsService,
+        test_user_id: str,
+    ) -> None:
+        """Test a zero-point round is kept as the lowest score."""
+        await analytics_service.update_player_stats_after_round(
+            user_id=test_user_id,  # type: ignore[arg-type]
+            contract_bid=0,
+            tricks_won=1,
+            round_score=0,
+        )
+        await analytics_service.update_player_stats_after_round(
+            user_id=test_user_id,  # type: ignore[arg-type]
+            contract_bid=1,
+            tricks_won=1,
+            round_score=11,
+        )
+
+        stats = await analytics_service.get_player_stats(test_user_id)  # type: ignore[arg-type]
+        assert stats.lowest_round_score == 0
+
     async def test_update_stats_trump_winner(
         self,
         analytics_service: AnalyticsService,
@@ -198,6 +265,43 @@ class TestPlayerStatsUpdate:
         stats = await analytics_service.get_player_stats(test_user_id)  # type: ignore[arg-type]
         assert stats.trump_win_count == 1
 
+    async def test_update_stats_for_whole_round(
+        self,
+        analytics_service: AnalyticsService,
+        db_session,  # type: ignore[no-untyped-def]
+        test_user_id: str,
+    ) -> None:
+        """Test one batched update applies each player's own result."""
+        other = User(
+            username="otheruser",
+            email="other@example.com",
+            display_name="Other User",
+            password_hash="hashed_password",
+        )
+        db_session.add(other)
+        await db_session.commit()
+
+        for _ in range(2):
+            await analytics_service.update_players_stats_after_round(
+                [
+                    RoundStatsUpdate(test_user_id, 4, 4, 26, is_trump_winner=True),  # type: ignore[arg-type]
+                    RoundStatsUpdate(other.id, 0, 1, -50),
+                ]
+            )
+
+        mine = await analytics_service.get_player_stats(test_user_id)  # type: ignore[arg-type]
+        assert mine.total_rounds == 2
+        assert mine.total_made_contracts == 2
+        assert mine.trump_win_count == 2
+        assert mine.current_streak == 2
+
+        theirs = await analytics_service.get_player_stats(other.id)
+        assert theirs.total_rounds == 2
+        assert theirs.zero_bid_failed == 2
+        assert theirs.trump_win_count == 0
+        assert theirs.current_streak == 0
+        assert theirs.lowest_round_score == -50
+
 
 class TestWinStreak:
     """Test win streak tracking."""
@@ -294,6 +398,29 @@ class TestGroupLeaderboard:
         leaderboard = await analytics_service.get_group_leaderboard(group_id)
         assert len(leaderboard) >= 0  # May be empty or have creator
 
+    async def test_group_leaderboard_ranks_by_points(
+        self,
+        analytics_service: AnalyticsService,
+        group_service,  # type: ignore[name-defined]
+        test_user_id: str,
+    ) -> None:
+        """Test leaderboard ranks members by lifetime points."""
+        group_id = await group_service.create_group(
+            user_id=test_user_id,  # type: ignore[arg-type]
+            name="Test Group",
+        )
+        await analytics_service.update_player_stats_after_round(
+            user_id=test_user_id,  # type: ignore[arg-type]
+            contract_bid=2,
+            tricks_won=2,
+            round_score=14,
+        )
+
+        leaderboard = await analytics_service.get_group_leaderboard(group_id)
+        assert [entry.rank for entry in leaderboard] == [1]
+        assert leaderboard[0].total_score == 14
+        assert leaderboard[0].average_round_score == 14.0
+
 
 class TestPlayerStatsMultipleRounds:
     """Test stats across multiple rounds."""
@@ -1,7 +1,11 @@
 """Authentication tests."""
+import time
+
 import pytest
 from httpx import AsyncClient
 
+from app.core.jwt_cache import JWTCache
+
 
 @pytest.mark.asyncio
 async def test_register_success(client: AsyncClient) -> None:
@@ -273,3 +277,22 @@ async def test_refresh_token_invalid(client: AsyncClient) -> None:
     assert response.status_code == 401
     data = response.json()
     assert data["error"] == "INVALID_CREDENTIALS"
+
+
+def test_jwt_cache_hit_and_expiry() -> None:
+    """Test JWT cache returns verified claims and honors exp."""
+    cache = JWTCache(max_size=2, ttl_seconds=30)
+    payload = {"sub": "user", "exp": time.time() + 60}
+    cache.set("token-a", payload)
+    assert cache.get("token-a") is payload
+    assert cache.get("token-b") is None
+
+    # Already-expired tokens are never cached
+    cache.set("token-b", {"sub": "user", "exp": time.time() - 1})
+    assert cache.get("token-b") is None
+
+    # Oldest entry is evicted past max_size
+    cache.set("token-c", payload)
+    cache.set("token-d", payload)
+    assert cache.get("token-a") is None
+    assert cache.get("token-d") is payload
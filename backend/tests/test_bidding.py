@@ -310,3 +310,15 @@ async def test_no_trump_highest_suit(client: AsyncClient) -> None:
     assert error is None
 
     await redis.close()
+
+
+def test_trump_suit_rank_ordering() -> None:
+    """Test that TrumpSuit compares by rank while keeping string values."""
+    assert TrumpSuit.CLUBS < TrumpSuit.DIAMONDS < TrumpSuit.HEARTS
+    assert TrumpSuit.HEARTS < TrumpSuit.SPADES < TrumpSuit.NO_TRUMP
+    assert max(TrumpSuit) is TrumpSuit.NO_TRUMP
+    assert tuple(TrumpSuit) == tuple(sorted(TrumpSuit))
+    # Hashing stays str-compatible so members and raw values share dict keys
+    assert {TrumpSuit.HEARTS: 1}["hearts"] == 1
+    assert TrumpSuit("spades") is TrumpSuit.SPADES
+    assert TrumpSuit.NO_TRUMP.value == "no_trump"
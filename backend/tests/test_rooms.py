@@ -1,6 +1,16 @@
 """Room service tests."""
 import pytest
 from httpx import AsyncClient
+from redis.asyncio import Redis
+
+from app.schemas.game import TrumpSuit
+from app.services.bidding_service import BiddingService
+from app.services.room_code_generator import (
+    ROOM_CODE_CHARS,
+    ROOM_CODE_LENGTH,
+    generate_room_code,
+)
+from app.services.room_keys import forget_room, queue_room_ttl_refresh
 
 
 @pytest.mark.asyncio  # type: ignore
@@ -535,3 +545,48 @@ async def test_room_code_unique(client: AsyncClient) -> None:
 
     # All codes should be unique
     assert len(room_codes) == 5
+
+
+def test_generate_room_code_format() -> None:
+    """Test generated room codes use only the unambiguous alphabet."""
+    for _ in range(200):
+        code = generate_room_code()
+        assert len(code) == ROOM_CODE_LENGTH
+        assert set(code) <= set(ROOM_CODE_CHARS)
+
+
+@pytest.mark.asyncio  # type: ignore
+async def test_room_ttl_refresh_is_sparse(redis: Redis) -> None:  # type: ignore[type-arg]
+    """Test room TTLs are re-armed only when the deadline moves meaningfully."""
+    ttl = 24 * 3600
+    await redis.hset("room:TTL234", "status", "waiting")
+
+    pipe = redis.pipeline()
+    assert queue_room_ttl_refresh(pipe, "TTL234", ttl) is True
+    await pipe.execute()
+    assert await redis.ttl("room:TTL234") > 0
+
+    # Fresh deadline: nothing queued unless forced
+    assert queue_room_ttl_refresh(redis.pipeline(), "TTL234", ttl) is False
+    assert queue_room_ttl_refresh(redis.pipeline(), "TTL234", ttl, force=True) is True
+
+    forget_room("TTL234")
+    assert queue_room_ttl_refresh(redis.pipeline(), "TTL234", ttl) is True
+    forget_room("TTL234")
+
+
+@pytest.mark.asyncio  # type: ignore
+async def test_room_keys_created_after_refresh_expire(redis: Redis) -> None:  # type: ignore[type-arg]
+    """Test keys created inside the refresh skip window still get a TTL."""
+    await redis.hset("room:TTL567", "status", "bidding_trump")
+    pipe = redis.pipeline()
+    queue_room_ttl_refresh(pipe, "TTL567", 24 * 3600, force=True)
+    await pipe.execute()
+
+    # Created after the refresh, while further refreshes are skipped
+    ok, _ = await BiddingService(redis).set_trump(
+        "TTL567", "u1", "Alice", TrumpSuit.SPADES, 5
+    )
+    assert ok
+    assert await redis.ttl("room:TTL567:round") > 0
+    forget_room("TTL567")
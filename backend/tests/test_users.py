@@ -2,6 +2,10 @@
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import PlayerStats  # type: ignore[attr-defined]
+from app.services.user_service import UserService
 
 
 @pytest.mark.asyncio  # type: ignore
@@ -368,3 +372,16 @@ async def test_get_user_public(client: AsyncClient) -> None:
     assert response.status_code == 200
     data = response.json()
     assert data["username"] == "testuser"
+
+
+@pytest.mark.asyncio  # type: ignore
+async def test_get_user_stats_before_first_round(
+    db_session: AsyncSession, test_user_id: str
+) -> None:
+    """Test a stats row with no rounds reports no lowest score."""
+    db_session.add(PlayerStats(user_id=test_user_id))
+    await db_session.flush()
+
+    stats = await UserService(db_session).get_user_stats(test_user_id)  # type: ignore[arg-type]
+    assert stats.total_rounds == 0
+    assert stats.lowest_score is None
@@ -1,54 +1,71 @@
 """WebSocket server tests."""
 import pytest
 from httpx import AsyncClient
+from redis.asyncio import Redis
+
+from app.services.room_keys import (
+    ROOM_TTL_SECONDS,
+    forget_room,
+    queue_room_ttl_refresh,
+    room_keys,
+)
+from app.websocket.connection_context import ConnectionContext
+from app.websocket.room_manager import RoomManager
+from app.websocket.schemas import (
+    ClientEvents,
+    ErrorPayload,
+    GamePhase,
+    PlayerInfo,
+    RoomJoinPayload,
+    RoomLeavePayload,
+    ServerEvents,
+    WSErrorCode,
+)
+from app.websocket.server import create_socketio_server
+
+
+async def register_user(client: AsyncClient, name: str) -> str:
+    """Register a user named ``name`` and return their access token."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "username": name,
+            "email": f"{name}@example.com",
+            "password": "TestPass123",
+            "display_name": name.capitalize(),
+        },
+    )
+    assert response.status_code == 201
+    return str(response.json()["tokens"]["access_token"])
 
 
+@pytest.mark.parametrize(  # type: ignore
+    ("path", "expected_status", "expected_keys"),
+    [
+        ("/health", "ok", {"version"}),
+        ("/api/v1", "ready", {"name", "version"}),
+    ],
+)
 @pytest.mark.asyncio  # type: ignore
-async def test_connect_without_auth(client: AsyncClient) -> None:
-    """Test connection rejection without authentication token."""
-    # Note: This test verifies the WebSocket would reject unauthenticated clients
-    # Actual WebSocket testing requires socket.io client library
-    # For now, we test HTTP endpoints that verify auth tokens work
-    response = await client.get("/health")
-    assert response.status_code == 200
-
-
-@pytest.mark.asyncio  # type: ignore
-async def test_health_check_endpoint(client: AsyncClient) -> None:
-    """Test health check endpoint is available."""
-    response = await client.get("/health")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["status"] == "ok"
-    assert "version" in data
-
-
-@pytest.mark.asyncio  # type: ignore
-async def test_api_info_endpoint(client: AsyncClient) -> None:
-    """Test API info endpoint."""
-    response = await client.get("/api/v1")
+async def test_public_endpoints(
+    client: AsyncClient,
+    path: str,
+    expected_status: str,
+    expected_keys: set[str],
+) -> None:
+    """Test unauthenticated health and API info endpoints."""
+    response = await client.get(path)
     assert response.status_code == 200
     data = response.json()
-    assert data["status"] == "ready"
-    assert "name" in data
-    assert "version" in data
+    assert data["status"] == expected_status
+    assert expected_keys <= data.keys()
 
 
 @pytest.mark.asyncio  # type: ignore
 async def test_room_endpoint_authenticated(client: AsyncClient) -> None:
     """Test room endpoints require authentication."""
     # Register user
-    reg_response = await client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "user",
-            "email": "user@example.com",
-            "password": "TestPass123",
-            "display_name": "User",
-        },
-    )
-    assert reg_response.status_code == 201
-    access_token = reg_response.json()["tokens"]["access_token"]
+    access_token = await register_user(client, "user")
 
     # Create room (authenticated endpoint)
     response = await client.post(
@@ -66,16 +83,7 @@ async def test_room_endpoint_authenticated(client: AsyncClient) -> None:
 async def test_room_create_and_join(client: AsyncClient) -> None:
     """Test creating and joining a room."""
     # Register admin
-    admin_response = await client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "admin",
-            "email": "admin@example.com",
-            "password": "TestPass123",
-            "display_name": "Admin",
-        },
-    )
-    admin_token = admin_response.json()["tokens"]["access_token"]
+    admin_token = await register_user(client, "admin")
 
     # Create room
     create_response = await client.post(
@@ -87,16 +95,7 @@ async def test_room_create_and_join(client: AsyncClient) -> None:
     room_code = create_response.json()["room_code"]
 
     # Register player
-    player_response = await client.post(
-        "/api/v1/auth/register",
-        json={
-            "username": "player",
-            "email": "player@example.com",
-            "password": "TestPass123",
-            "display_name": "Player",
-        },
-    )
-    player_token = player_response.json()["tokens"]["access_token"]
+    player_token = await register_user(client, "player")
 
     # Join room (HTTP join, not WebSocket)
     join_response = await client.post(
@@ -113,17 +112,6 @@ async def test_room_create_and_join(client: AsyncClient) -> None:
 @pytest.mark.asyncio  # type: ignore
 async def test_websocket_schemas_valid(client: AsyncClient) -> None:
     """Test that WebSocket schemas are properly defined."""
-    # This verifies schemas can be imported and instantiated
-    from app.websocket.schemas import (
-        ClientEvents,
-        ErrorPayload,
-        GamePhase,
-        RoomJoinPayload,
-        RoomLeavePayload,
-        ServerEvents,
-        WSErrorCode,
-    )
-
     # Test creating payloads
     join_payload = RoomJoinPayload(room_code="ABC123", display_name="Test")
     assert join_payload.room_code == "ABC123"
@@ -149,11 +137,23 @@ async def test_websocket_schemas_valid(client: AsyncClient) -> None:
     assert WSErrorCode.ROOM_NOT_FOUND.value == "WS_ROOM_001"
 
 
+def test_player_info_redis_round_trip() -> None:
+    """Test stored player blobs omit the timestamp and unset fields."""
+    player = PlayerInfo(user_id="u1", display_name="Alice", seat_position=2)
+
+    blob = player.to_redis()
+    assert "timestamp" not in blob
+    assert "avatar_url" not in blob
+
+    restored = PlayerInfo.model_validate_json(blob)
+    assert restored.model_dump(exclude={"timestamp"}) == player.model_dump(
+        exclude={"timestamp"}
+    )
+
+
 @pytest.mark.asyncio  # type: ignore
 async def test_connection_context_creation(client: AsyncClient) -> None:
     """Test ConnectionContext can be created."""
-    from app.websocket.connection_context import ConnectionContext
-
     # Create a mock context
     ctx = ConnectionContext(
         sio=None,  # type: ignore
@@ -168,19 +168,14 @@ async def test_connection_context_creation(client: AsyncClient) -> None:
     assert ctx.display_name == "Test User"
     assert ctx.is_authenticated is True
     assert ctx.current_room is None
+    # One context per socket: keep instances free of a per-instance __dict__
+    assert not hasattr(ctx, "__dict__")
 
 
 @pytest.mark.asyncio  # type: ignore
-async def test_room_manager_initialization(client: AsyncClient) -> None:
+async def test_room_manager_initialization(redis: Redis) -> None:  # type: ignore[type-arg]
     """Test RoomManager can be initialized."""
-    from app.core.redis import redis_manager
-    from app.websocket.room_manager import RoomManager
-
-    # Initialize Redis if not already done
-    await redis_manager.initialize("redis://localhost:6379")
-
-    # Create room manager
-    manager = RoomManager(redis_manager.redis, None)  # type: ignore
+    manager = RoomManager(redis, None)
 
     assert manager.redis is not None
     assert manager.ROOM_TTL.total_seconds() == 86400  # 24 hours
@@ -188,16 +183,109 @@ async def test_room_manager_initialization(client: AsyncClient) -> None:
 
 
 @pytest.mark.asyncio  # type: ignore
-async def test_websocket_server_creation(client: AsyncClient) -> None:
-    """Test Socket.IO server can be created."""
-    from app.core.redis import redis_manager
-    from app.websocket.server import create_socketio_server
+async def test_room_manager_join_room(redis: Redis) -> None:  # type: ignore[type-arg]
+    """Test joining seats the player, tracks the socket and refreshes TTLs."""
+    manager = RoomManager(redis, None)
+    await redis.hset(
+        "room:ABC234",
+        mapping={"game_id": "g1", "admin_id": "u1", "status": "waiting"},
+    )
+    # Left behind by a socket whose tracking hash already expired
+    await redis.sadd("ws:room:ABC234", "sid-dead")
+
+    result = await manager.join_room("abc234", "u1", "Alice", "sid-1")
+
+    assert result.seat_position == 0
+    assert result.is_admin is True
+    assert [p.user_id for p in result.players] == ["u1"]
+    assert await redis.get("ws:user:u1") == b"sid-1"
+    assert await redis.ttl("room:ABC234:players") > 0
+    assert await redis.smembers("ws:room:ABC234") == {b"sid-1"}
+    assert await manager.is_player_in_room("ABC234", "u1")
+
+    second = await manager.join_room("ABC234", "u2", "Bob", "sid-2")
+    assert second.seat_position == 1
+    assert [p.user_id for p in second.players] == ["u1", "u2"]
+
+    left = await manager.leave_room("ABC234", "u2")
+    assert left.room_still_exists is True
+    assert left.broadcast_payload is not None
+    assert left.broadcast_payload.player_count == 1
+    assert not await redis.exists("ws:socket:sid-2", "ws:user:u2")
+
+
+@pytest.mark.asyncio  # type: ignore
+async def test_room_manager_disconnect_and_rejoin(redis: Redis) -> None:  # type: ignore[type-arg]
+    """Test an in-game disconnect keeps the seat and a rejoin restores it."""
+    manager = RoomManager(redis, None)
+    await redis.hset(
+        "room:XYZ789",
+        mapping={"game_id": "g1", "admin_id": "u1", "status": "playing"},
+    )
+    await manager.join_room("XYZ789", "u1", "Alice", "sid-1")
 
-    # Initialize Redis
-    await redis_manager.initialize("redis://localhost:6379")
+    assert await manager.handle_disconnect("sid-1") == ("XYZ789", "u1")
+    assert not await redis.exists("ws:socket:sid-1", "ws:user:u1")
+    assert not await redis.sismember("ws:room:XYZ789", "sid-1")
+    assert await redis.exists("reconnect:u1")
+    player = PlayerInfo.model_validate_json(await redis.hget("room:XYZ789:players", "0"))
+    assert player.is_connected is False
 
-    # Create server
-    sio = create_socketio_server(redis_manager.redis)  # type: ignore
+    result = await manager.join_room("XYZ789", "u1", "Alice", "sid-2")
+    assert result.seat_position == 0
+    assert result.player_info.is_connected is True
+    assert await redis.get("ws:user:u1") == b"sid-2"
+
+    # A late cleanup of the old socket must not drop the new pointer
+    await redis.hset("ws:socket:sid-1", mapping={"user_id": "u1", "room_code": "XYZ789"})
+    await manager._clear_connection("sid-1")
+    assert not await redis.exists("ws:socket:sid-1")
+    assert await redis.get("ws:user:u1") == b"sid-2"
+
+
+@pytest.mark.asyncio  # type: ignore
+async def test_room_manager_socket_set_expires(redis: Redis) -> None:  # type: ignore[type-arg]
+    """Test the ws:room set gets a TTL on join and on reconnect."""
+    manager = RoomManager(redis, None)
+    await redis.hset(
+        "room:QRS456",
+        mapping={"game_id": "g1", "admin_id": "u1", "status": "playing"},
+    )
+    # Room creation refreshed TTLs, so joins inside the window skip it
+    pipe = redis.pipeline()
+    queue_room_ttl_refresh(pipe, "QRS456", ROOM_TTL_SECONDS, force=True)
+    await pipe.execute()
+
+    await manager.join_room("QRS456", "u1", "Alice", "sid-1")
+    assert await redis.ttl("ws:room:QRS456") > 0
+
+    await redis.unlink("ws:room:QRS456")
+    await manager.join_room("QRS456", "u1", "Alice", "sid-2")
+    assert await redis.ttl("ws:room:QRS456") > 0
+    forget_room("QRS456")
+
+
+@pytest.mark.asyncio  # type: ignore
+async def test_room_manager_last_leave_deletes_room_keys(redis: Redis) -> None:  # type: ignore[type-arg]
+    """Test the last player leaving removes every room key, bids included."""
+    manager = RoomManager(redis, None)
+    await redis.hset(
+        "room:DEF234",
+        mapping={"game_id": "g1", "admin_id": "u1", "status": "waiting"},
+    )
+    await manager.join_room("DEF234", "u1", "Alice", "sid-1")
+    await redis.hset("room:DEF234:contracts", "u1", 3)
+
+    left = await manager.leave_room("DEF234", "u1")
+
+    assert left.room_still_exists is False
+    assert not await redis.exists(*room_keys("DEF234"))
+
+
+@pytest.mark.asyncio  # type: ignore
+async def test_websocket_server_creation(redis: Redis) -> None:  # type: ignore[type-arg]
+    """Test Socket.IO server can be created."""
+    sio = create_socketio_server(redis)
 
     assert sio is not None
     assert sio.async_mode == "asgi"